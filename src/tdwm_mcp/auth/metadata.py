@@ -3,12 +3,72 @@ Protected Resource Metadata Handler (RFC 9728)
 Provides OAuth 2.1 protected resource metadata endpoint for discovery.
 """
 
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 import logging
 from .config import OAuthConfig
 
 logger = logging.getLogger(__name__)
 
+# Required scopes for each operation type
+SCOPE_MAPPING: Mapping[str, List[str]] = MappingProxyType({
+    'read': ['tdwm:read'],
+    'write': ['tdwm:write', 'tdwm:read'], 
+    'admin': ['tdwm:admin'],
+    'query': ['tdwm:query', 'tdwm:read'],
+    'monitor': ['tdwm:monitor', 'tdwm:read'],
+    'workload': ['tdwm:workload', 'tdwm:admin'],
+    'list': ['tdwm:read'],
+    'show': ['tdwm:read'],
+    'execute': ['tdwm:query', 'tdwm:read'],
+    'manage': ['tdwm:admin']
+})
+
+# Map tool names to operation types for scope checking
+TOOL_OPERATION_MAP: Mapping[str, str] = MappingProxyType({
+    # Session monitoring tools
+    'show_sessions': 'read',
+    'show_sql_steps_for_session': 'read',
+    'show_sql_text_for_session': 'read',
+    'monitor_session_query_band': 'monitor',
+    
+    # System monitoring tools
+    'monitor_amp_load': 'monitor',
+    'monitor_awt': 'monitor', 
+    'monitor_config': 'monitor',
+    'show_physical_resources': 'read',
+    
+    # Workload management tools
+    'list_active_WD': 'read',
+    'list_WD': 'read',
+    'show_tdwm_summary': 'read',
+    'list_delayed_request': 'read',
+    'display_delay_queue': 'read',
+    'show_trottle_statistics': 'read',
+    'list_query_band': 'read',
+    
+    # Administrative tools
+    'abort_sessions_user': 'admin',
+    'abort_delayed_request': 'admin',
+    'release_delay_queue': 'admin',
+    'batch_configure': 'admin',
+    'add_classifications_to_rule': 'admin',
+    
+    # Query and analysis tools
+    'show_query_log': 'query',
+    'show_top_users': 'query',
+    'show_sw_event_log': 'read',
+    'show_tasm_statistics': 'monitor',
+    'show_tasm_even_history': 'read',
+    'show_tasm_rule_history_red': 'read',
+    
+    # System information tools
+    'identify_blocking': 'read',
+    'list_utility_stats': 'read',
+    'show_cod_limits': 'read',
+    'tdwm_list_clasification': 'read',
+})
+
 
 class ProtectedResourceMetadata:
     """Handler for OAuth Protected Resource Metadata (RFC 9728)."""
@@ -146,20 +206,7 @@ class ProtectedResourceMetadata:
         Returns:
             List of required scopes for the operation
         """
-        scope_mapping = {
-            'read': ['tdwm:read'],
-            'write': ['tdwm:write', 'tdwm:read'], 
-            'admin': ['tdwm:admin'],
-            'query': ['tdwm:query', 'tdwm:read'],
-            'monitor': ['tdwm:monitor', 'tdwm:read'],
-            'workload': ['tdwm:workload', 'tdwm:admin'],
-            'list': ['tdwm:read'],
-            'show': ['tdwm:read'],
-            'execute': ['tdwm:query', 'tdwm:read'],
-            'manage': ['tdwm:admin']
-        }
-        
-        return scope_mapping.get(operation_type.lower(), ['tdwm:read'])
+        return SCOPE_MAPPING.get(operation_type.lower(), ['tdwm:read'])
     
     def validate_scopes_for_tool(self, tool_name: str, user_scopes: List[str]) -> bool:
         """
@@ -172,55 +219,7 @@ class ProtectedResourceMetadata:
         Returns:
             True if user has sufficient scopes, False otherwise
         """
-        # Map tool names to operation types
-        tool_operation_mapping = {
-            # Session monitoring tools
-            'show_sessions': 'read',
-            'show_sql_steps_for_session': 'read',
-            'show_sql_text_for_session': 'read',
-            'monitor_session_query_band': 'monitor',
-            
-            # System monitoring tools
-            'monitor_amp_load': 'monitor',
-            'monitor_awt': 'monitor', 
-            'monitor_config': 'monitor',
-            'show_physical_resources': 'read',
-            
-            # Workload management tools
-            'list_active_WD': 'read',
-            'list_WD': 'read',
-            'show_tdwm_summary': 'read',
-            'list_delayed_request': 'read',
-            'display_delay_queue': 'read',
-            'show_trottle_statistics': 'read',
-            'list_query_band': 'read',
-            
-            # Administrative tools
-            'abort_sessions_user': 'admin',
-            'abort_delayed_request': 'admin',
-            'release_delay_queue': 'admin',
-            'create_filter_rule': 'admin',
-            'add_class_criteria': 'admin',
-            'enable_filter_in_default': 'admin',
-            'enable_filter_rule': 'admin',
-            'activate_rulset': 'admin',
-            
-            # Query and analysis tools
-            'show_query_log': 'query',
-            'show_top_users': 'query',
-            'show_sw_event_log': 'read',
-            'show_tasm_statistics': 'monitor',
-            'show_tasm_even_history': 'read',
-            'show_tasm_rule_history_red': 'read',
-            
-            # System information tools
-            'identify_blocking': 'read',
-            'list_utility_stats': 'read',
-            'show_cod_limits': 'read',
-            'tdwm_list_clasification': 'read',
-        }
-        
-        operation_type = tool_operation_mapping.get(tool_name, 'read')
+        operation_type = TOOL_OPERATION_MAP.get(tool_name, 'read')
         required_scopes = self.get_scopes_for_operation(operation_type)
         
         # Check if user has any of the required scopes
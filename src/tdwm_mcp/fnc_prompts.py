@@ -5,13 +5,25 @@ This module contains all the prompt functions that are exposed through the MCP s
 """
 
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 import mcp.types as types
 from .prompt import PROMPTS
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def render_prompt(name: str, params: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Substitute arguments into a prompt template.
+
+    params is the sorted tuple of (argument, value) pairs so that repeated
+    requests with the same arguments reuse the rendered text.
+    """
+    return PROMPTS.render(name, dict(params))
+
+
 async def handle_list_prompts() -> list[types.Prompt]:
     """List available prompts."""
     logger.debug("Handling list_prompts request")
@@ -39,19 +51,14 @@ async def handle_get_prompt(name: str, arguments: Dict[str, str] | None) -> type
     if name not in PROMPTS:
         raise ValueError(f"Unknown prompt: {name}")
     
-    prompt_info = PROMPTS[name]
-    
-    # Get the prompt template
-    template = prompt_info.get("template", "")
-    
     # Replace placeholders with arguments
     try:
-        formatted_template = template.format(**arguments)
+        formatted_template = render_prompt(name, tuple(sorted(arguments.items())))
     except KeyError as e:
         raise ValueError(f"Missing required argument for prompt '{name}': {e}")
     
     return types.GetPromptResult(
-        description=prompt_info.get("description", f"Generated prompt: {name}"),
+        description=f"Generated prompt: {name}",
         messages=[
             types.PromptMessage(
                 role="user",
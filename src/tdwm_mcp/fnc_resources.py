@@ -14,17 +14,12 @@ from urllib.parse import urlparse
 from .connection_manager import TeradataConnectionManager
 from .retry_utils import with_connection_retry
 from .fnc_common import get_connection
+from .tdwm_static import TDWM_CLASIFICATION_TYPE_TEXT
 
 # Import reference data resource handlers
 from .resource_reference import (
-    get_classification_types_all,
-    get_classification_types_by_category,
-    get_operators_reference,
-    get_subcriteria_reference,
-    get_actions_reference,
-    get_throttle_types_reference,
-    get_states_reference,
-    get_reference_catalog
+    REFERENCE_HANDLERS,
+    get_classification_types_by_category
 )
 
 # Import template resource handlers
@@ -274,7 +269,7 @@ async def handle_read_resource(uri: str) -> str:
     # Convert AnyUrl object to string if needed
     uri = str(uri)
 
-    logger.debug(f"Handling read_resource request for: {uri}")
+    logger.debug("Handling read_resource request for: %s", uri)
 
     try:
         # Legacy/Basic Resources
@@ -298,28 +293,16 @@ async def handle_read_resource(uri: str) -> str:
             return await _get_classification_types_resource()
 
         # Reference Data Resources (Phase 1)
-        elif uri == "tdwm://reference/classification-types":
-            return await get_classification_types_all()
-        elif uri == "tdwm://reference/operators":
-            return await get_operators_reference()
-        elif uri == "tdwm://reference/subcriteria-types":
-            return await get_subcriteria_reference()
-        elif uri == "tdwm://reference/actions":
-            return await get_actions_reference()
-        elif uri == "tdwm://reference/throttle-types":
-            return await get_throttle_types_reference()
-        elif uri == "tdwm://reference/states":
-            return await get_states_reference()
-        elif uri == "tdwm://reference/catalog":
-            return await get_reference_catalog()
+        elif (reference_handler := REFERENCE_HANDLERS.get(uri)) is not None:
+            return reference_handler()
 
         # Template Resources (Phase 2)
         elif uri == "tdwm://templates/throttle":
-            return await get_throttle_templates_list()
+            return get_throttle_templates_list()
         elif uri == "tdwm://templates/filter":
-            return await get_filter_templates_list()
+            return get_filter_templates_list()
         elif uri == "tdwm://templates/catalog":
-            return await get_templates_catalog()
+            return get_templates_catalog()
 
         # Ruleset Exploration Resources (Phase 3)
         elif uri == "tdwm://rulesets":
@@ -329,21 +312,21 @@ async def handle_read_resource(uri: str) -> str:
 
         # Workflow Resources (Phase 4)
         elif uri == "tdwm://workflows":
-            return await get_workflows_list()
+            return get_workflows_list()
 
         # Parameterized Resources (using regex matching)
         # tdwm://reference/classification-types/{category}
         elif match := re.match(r"tdwm://reference/classification-types/(.+)", uri):
             category = match.group(1)
-            return await get_classification_types_by_category(category)
+            return get_classification_types_by_category(category)
         # tdwm://template/throttle/{template_id}
         elif match := re.match(r"tdwm://template/throttle/(.+)", uri):
             template_id = match.group(1)
-            return await get_throttle_template(template_id)
+            return get_throttle_template(template_id)
         # tdwm://template/filter/{template_id}
         elif match := re.match(r"tdwm://template/filter/(.+)", uri):
             template_id = match.group(1)
-            return await get_filter_template(template_id)
+            return get_filter_template(template_id)
         # tdwm://ruleset/{ruleset_name}/throttle/{throttle_name}
         elif match := re.match(r"tdwm://ruleset/([^/]+)/throttle/(.+)", uri):
             ruleset_name = match.group(1)
@@ -373,13 +356,13 @@ async def handle_read_resource(uri: str) -> str:
         # tdwm://workflow/{workflow_id}
         elif match := re.match(r"tdwm://workflow/(.+)", uri):
             workflow_id = match.group(1)
-            return await get_workflow(workflow_id)
+            return get_workflow(workflow_id)
 
         else:
             raise ValueError(f"Unknown resource URI: {uri}")
 
     except Exception as e:
-        logger.error(f"Error reading resource {uri}: {e}")
+        logger.error("Error reading resource %s: %s", uri, e)
         return format_error_response(str(e))
 
 
@@ -393,7 +376,7 @@ async def _get_sessions_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting sessions resource: {e}")
+        logger.error("Error getting sessions resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -407,7 +390,7 @@ async def _get_workloads_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting workloads resource: {e}")
+        logger.error("Error getting workloads resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -421,7 +404,7 @@ async def _get_active_workloads_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting active workloads resource: {e}")
+        logger.error("Error getting active workloads resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -435,7 +418,7 @@ async def _get_summary_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting summary resource: {e}")
+        logger.error("Error getting summary resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -449,7 +432,7 @@ async def _get_delayed_queries_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting delayed queries resource: {e}")
+        logger.error("Error getting delayed queries resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -463,7 +446,7 @@ async def _get_throttle_statistics_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting throttle statistics resource: {e}")
+        logger.error("Error getting throttle statistics resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -477,7 +460,7 @@ async def _get_physical_resources_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting physical resources resource: {e}")
+        logger.error("Error getting physical resources resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -491,7 +474,7 @@ async def _get_amp_load_resource() -> str:
         result = list([row for row in rows.fetchall()])
         return format_text_response(result)
     except Exception as e:
-        logger.error(f"Error getting AMP load resource: {e}")
+        logger.error("Error getting AMP load resource: %s", e)
         return format_error_response(str(e))
 
 
@@ -499,9 +482,7 @@ async def _get_amp_load_resource() -> str:
 async def _get_classification_types_resource() -> str:
     """Get classification types resource."""
     try:
-        from .tdwm_static import TDWM_CLASIFICATION_TYPE
-        result = list([(entry[1], entry[2], entry[3], entry[4]) for entry in TDWM_CLASIFICATION_TYPE])
-        return format_text_response(result)
+        return format_text_response(TDWM_CLASIFICATION_TYPE_TEXT)
     except Exception as e:
-        logger.error(f"Error getting classification types resource: {e}")
+        logger.error("Error getting classification types resource: %s", e)
         return format_error_response(str(e))
\ No newline at end of file
@@ -10,14 +10,134 @@ These tools implement Priority 1 capabilities from the enhancement recommendatio
 - Rule Management (add criteria, set limits, activate)
 """
 
+import inspect
 import logging
-from typing import Any, List, Optional, Dict
+import time
+from typing import Any, List, Optional, Dict, Tuple
 
 import mcp.types as types
+import teradatasql
 from .fnc_common import format_text_response, format_error_response, get_connection, ResponseType, with_connection_retry
+from .resource_queries import invalidate_resource_cache
 
 logger = logging.getLogger(__name__)
 
+# TDWM procedure calls; fixed text with bound parameters so the request
+# cache reuses one parse per statement
+_CALL_ACTIVATE_RULESET = "CALL TDWM.TDWMActivateRuleset(?)"
+_CALL_CREATE_SYSTEM_THROTTLE = "CALL TDWM.TDWMCreateSystemThrottle(?, ?, ?, ?, ?)"
+_CALL_CREATE_FILTER = "CALL TDWM.TDWMCreateFilter(?, ?, ?, ?, ?)"
+_CALL_DELETE_RULE = "CALL TDWM.TDWMDeleteRule(?, ?)"
+_CALL_MANAGE_RULE = "CALL TDWM.TDWMManageRule(?, ?, ?)"
+_CALL_ADD_LIMIT_FOR_RULE_STATE = "CALL TDWM.TDWMAddLimitForRuleState(?, ?, ?, ?, ?, ?, ?)"
+_CALL_ADD_CLASSIFICATION_FOR_RULE = "CALL TDWM.TDWMAddClassificationForRule(?, ?, ?, ?, ?, ?, ?)"
+_CALL_ADD_CLASSIFICATION_FOR_TARGET = "CALL TDWM.TDWMAddClassificationForTarget(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Cached (name, timestamp) of the active ruleset; activation invalidates it
+ACTIVE_RULESET_CACHE_TTL = 30.0
+_active_ruleset_cache: Optional[Tuple[str, float]] = None
+# Bumped on invalidation so a lookup already in flight does not store a stale name
+_active_ruleset_generation = 0
+
+
+def invalidate_active_ruleset_cache() -> None:
+    """Forget the cached active ruleset name."""
+    global _active_ruleset_cache, _active_ruleset_generation
+    _active_ruleset_generation += 1
+    _active_ruleset_cache = None
+
+
+def _activate_ruleset(cur, ruleset_name: str, defer_activate: bool = False) -> None:
+    """
+    Activate a ruleset on an open cursor unless deferred, then drop the cached
+    ruleset resources (and the cached active ruleset name on activation).
+
+    Every configuration change ends here, so the cache is invalidated exactly
+    once per change whether or not the ruleset is activated.
+    """
+    if not defer_activate:
+        logger.debug("Activating ruleset %s", ruleset_name)
+        cur.execute(
+            _CALL_ACTIVATE_RULESET,
+            [ruleset_name]
+        )
+        invalidate_active_ruleset_cache()
+    invalidate_resource_cache()
+
+
+def _add_rule_classifications(
+    cur,
+    ruleset_name: str,
+    rule_name: str,
+    classification_criteria: List[Dict[str, str]]
+) -> None:
+    """
+    Add classification criteria to a rule on an open cursor.
+
+    Args:
+        cur: Cursor of the connection running the configuration change
+        ruleset_name: Name of the ruleset
+        rule_name: Name of the rule to modify
+        classification_criteria: List of classification criteria
+            [{"description": "...", "type": "APPL", "value": "MyApp", "operator": "I"}]
+    """
+    if not classification_criteria:
+        return
+    logger.debug("Adding %d classification criteria to rule %s", len(classification_criteria), rule_name)
+    params_list = [
+        [
+            ruleset_name,
+            rule_name,
+            criteria.get('description', f"{criteria['type']} classification"),
+            criteria['type'],
+            criteria['value'],
+            criteria.get('operator', 'I'),
+            'N'
+        ]
+        for criteria in classification_criteria
+    ]
+    try:
+        # One batched request instead of a round-trip per criterion
+        cur.executemany(_CALL_ADD_CLASSIFICATION_FOR_RULE, params_list)
+    except teradatasql.NotSupportedError:
+        # The iterated CALL was rejected before any row ran; add them one by one
+        logger.debug("Batched CALL not supported, adding criteria one at a time")
+        for params in params_list:
+            cur.execute(_CALL_ADD_CLASSIFICATION_FOR_RULE, params)
+
+
+async def _run_rule_ops(
+    ruleset_name: str,
+    ops: List[Tuple[str, List[Any]]],
+    success_message: str,
+    action: str,
+    defer_activate: bool
+) -> ResponseType:
+    """
+    Run TDWM procedure calls on one cursor, then activate the ruleset.
+
+    Args:
+        ruleset_name: Ruleset the calls change
+        ops: (CALL statement, parameters) pairs executed in order
+        success_message: Response text when every call succeeds
+        action: What the calls do, used in the error log ("deleting throttle")
+        defer_activate: Skip TDWMActivateRuleset
+    """
+    try:
+        tdconn = await get_connection()
+        cur = tdconn.cursor()
+
+        for sql, params in ops:
+            cur.execute(sql, params)
+
+        _activate_ruleset(cur, ruleset_name, defer_activate)
+
+        return format_text_response(success_message)
+    except Exception as e:
+        logger.error("Error %s: %s", action, e)
+        return format_error_response(str(e))
+
+
 #  ========== THROTTLE MANAGEMENT ==========
 
 @with_connection_retry()
@@ -27,7 +147,8 @@ async def create_system_throttle(
     description: str,
     throttle_type: str = "DM",
     limit: int = 5,
-    classification_criteria: Optional[List[Dict[str, str]]] = None
+    classification_criteria: Optional[List[Dict[str, str]]] = None,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Create a new system-level throttle to limit concurrent queries.
@@ -40,61 +161,47 @@ async def create_system_throttle(
         limit: Maximum concurrent queries allowed
         classification_criteria: Optional list of classification criteria
             [{"description": "...", "type": "APPL", "value": "MyApp", "operator": "I"}]
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
     try:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
         # 1. Create system throttle
-        logger.info(f"Creating system throttle {throttle_name} in ruleset {ruleset_name}")
+        logger.info("Creating system throttle %s in ruleset %s", throttle_name, ruleset_name)
         cur.execute(
-            """CALL TDWM.TDWMCreateSystemThrottle(?, ?, ?, ?, ?)""",
+            _CALL_CREATE_SYSTEM_THROTTLE,
             [ruleset_name, throttle_name, description, throttle_type, 'N']
         )
 
         # 2. Add classification criteria if provided
         if classification_criteria:
-            for criteria in classification_criteria:
-                logger.info(f"Adding classification criteria: {criteria['type']}={criteria['value']}")
-                cur.execute(
-                    """CALL TDWM.TDWMAddClassificationForRule(?, ?, ?, ?, ?, ?, ?)""",
-                    [
-                        ruleset_name,
-                        throttle_name,
-                        criteria.get('description', f"{criteria['type']} classification"),
-                        criteria['type'],
-                        criteria['value'],
-                        criteria.get('operator', 'I'),
-                        'N'
-                    ]
-                )
+            _add_rule_classifications(cur, ruleset_name, throttle_name, classification_criteria)
 
         # 3. Set default limit (action 'D' = delay)
-        logger.info(f"Setting throttle limit to {limit}")
+        logger.debug("Setting throttle limit to %s", limit)
         cur.execute(
-            """CALL TDWM.TDWMAddLimitForRuleState(?, ?, ?, ?, ?, ?, ?)""",
+            _CALL_ADD_LIMIT_FOR_RULE_STATE,
             [ruleset_name, throttle_name, 'DEFAULT', 'Default limit', str(limit), 'D', 'N']
         )
 
         # 4. Enable the throttle
-        logger.info(f"Enabling throttle {throttle_name}")
+        logger.debug("Enabling throttle %s", throttle_name)
         cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
+            _CALL_MANAGE_RULE,
             [ruleset_name, throttle_name, 'E']
         )
 
         # 5. Activate ruleset to make changes live
-        logger.info(f"Activating ruleset {ruleset_name}")
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
+        _activate_ruleset(cur, ruleset_name, defer_activate)
 
+        outcome = "created" if defer_activate else "created and activated"
         return format_text_response(
-            f"Successfully created and activated system throttle '{throttle_name}' with limit {limit}"
+            f"Successfully {outcome} system throttle '{throttle_name}' with limit {limit}"
         )
     except Exception as e:
-        logger.error(f"Error creating system throttle: {e}")
+        logger.error("Error creating system throttle: %s", e)
         return format_error_response(str(e))
 
 
@@ -102,7 +209,8 @@ async def create_system_throttle(
 async def modify_throttle_limit(
     ruleset_name: str,
     throttle_name: str,
-    new_limit: int
+    new_limit: int,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Modify the concurrency limit for an existing throttle.
@@ -111,37 +219,31 @@ async def modify_throttle_limit(
         ruleset_name: Name of the ruleset containing the throttle
         throttle_name: Name of the throttle to modify
         new_limit: New concurrency limit
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
-
-        logger.info(f"Modifying throttle {throttle_name} limit to {new_limit}")
-
-        # Update limit (ReplaceAction 'Y' = replace existing)
-        cur.execute(
-            """CALL TDWM.TDWMAddLimitForRuleState(?, ?, ?, ?, ?, ?, ?)""",
-            [ruleset_name, throttle_name, 'DEFAULT', 'Updated limit', str(new_limit), 'D', 'Y']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully updated throttle '{throttle_name}' limit to {new_limit}"
-        )
-    except Exception as e:
-        logger.error(f"Error modifying throttle limit: {e}")
-        return format_error_response(str(e))
+    logger.info("Modifying throttle %s limit to %s", throttle_name, new_limit)
+
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Update limit (ReplaceAction 'Y' = replace existing)
+            (
+                _CALL_ADD_LIMIT_FOR_RULE_STATE,
+                [ruleset_name, throttle_name, 'DEFAULT', 'Updated limit', str(new_limit), 'D', 'Y']
+            ),
+        ],
+        f"Successfully updated throttle '{throttle_name}' limit to {new_limit}",
+        "modifying throttle limit",
+        defer_activate
+    )
 
 
 @with_connection_retry()
 async def delete_throttle(
     ruleset_name: str,
-    throttle_name: str
+    throttle_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Delete a throttle rule.
@@ -149,37 +251,28 @@ async def delete_throttle(
     Args:
         ruleset_name: Name of the ruleset containing the throttle
         throttle_name: Name of the throttle to delete
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
-
-        logger.info(f"Deleting throttle {throttle_name} from ruleset {ruleset_name}")
-
-        # Delete the rule
-        cur.execute(
-            """CALL TDWM.TDWMDeleteRule(?, ?)""",
-            [ruleset_name, throttle_name]
-        )
+    logger.info("Deleting throttle %s from ruleset %s", throttle_name, ruleset_name)
 
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully deleted throttle '{throttle_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error deleting throttle: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Delete the rule
+            (_CALL_DELETE_RULE, [ruleset_name, throttle_name]),
+        ],
+        f"Successfully deleted throttle '{throttle_name}'",
+        "deleting throttle",
+        defer_activate
+    )
 
 
 @with_connection_retry()
 async def enable_throttle(
     ruleset_name: str,
-    throttle_name: str
+    throttle_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Enable (activate) a throttle rule.
@@ -187,37 +280,28 @@ async def enable_throttle(
     Args:
         ruleset_name: Name of the ruleset containing the throttle
         throttle_name: Name of the throttle to enable
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
+    logger.info("Enabling throttle %s", throttle_name)
 
-        logger.info(f"Enabling throttle {throttle_name}")
-
-        # Enable the rule (Operation 'E' = enable)
-        cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
-            [ruleset_name, throttle_name, 'E']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully enabled throttle '{throttle_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error enabling throttle: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Enable the rule (Operation 'E' = enable)
+            (_CALL_MANAGE_RULE, [ruleset_name, throttle_name, 'E']),
+        ],
+        f"Successfully enabled throttle '{throttle_name}'",
+        "enabling throttle",
+        defer_activate
+    )
 
 
 @with_connection_retry()
 async def disable_throttle(
     ruleset_name: str,
-    throttle_name: str
+    throttle_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Disable (deactivate) a throttle rule.
@@ -225,31 +309,21 @@ async def disable_throttle(
     Args:
         ruleset_name: Name of the ruleset containing the throttle
         throttle_name: Name of the throttle to disable
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
-
-        logger.info(f"Disabling throttle {throttle_name}")
-
-        # Disable the rule (Operation 'D' = disable)
-        cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
-            [ruleset_name, throttle_name, 'D']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
+    logger.info("Disabling throttle %s", throttle_name)
 
-        return format_text_response(
-            f"Successfully disabled throttle '{throttle_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error disabling throttle: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Disable the rule (Operation 'D' = disable)
+            (_CALL_MANAGE_RULE, [ruleset_name, throttle_name, 'D']),
+        ],
+        f"Successfully disabled throttle '{throttle_name}'",
+        "disabling throttle",
+        defer_activate
+    )
 
 
 # ========== FILTER MANAGEMENT ==========
@@ -260,7 +334,8 @@ async def create_filter(
     filter_name: str,
     description: str,
     classification_criteria: Optional[List[Dict[str, str]]] = None,
-    action: str = 'E'
+    action: str = 'E',
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Create a new filter rule to block/reject queries.
@@ -271,68 +346,55 @@ async def create_filter(
         description: Description of filter purpose
         classification_criteria: List of classification criteria
         action: 'E'=Exception (reject), 'A'=Abort
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
     try:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
         # 1. Create filter
-        logger.info(f"Creating filter {filter_name} in ruleset {ruleset_name}")
+        logger.info("Creating filter %s in ruleset %s", filter_name, ruleset_name)
         cur.execute(
-            """CALL TDWM.TDWMCreateFilter(?, ?, ?, ?, ?)""",
+            _CALL_CREATE_FILTER,
             [ruleset_name, filter_name, description, None, 'N']
         )
 
         # 2. Add classification criteria if provided
         if classification_criteria:
-            for criteria in classification_criteria:
-                logger.info(f"Adding filter criteria: {criteria['type']}={criteria['value']}")
-                cur.execute(
-                    """CALL TDWM.TDWMAddClassificationForRule(?, ?, ?, ?, ?, ?, ?)""",
-                    [
-                        ruleset_name,
-                        filter_name,
-                        criteria.get('description', f"{criteria['type']} classification"),
-                        criteria['type'],
-                        criteria['value'],
-                        criteria.get('operator', 'I'),
-                        'N'
-                    ]
-                )
+            _add_rule_classifications(cur, ruleset_name, filter_name, classification_criteria)
 
         # 3. Enable filter in default state
-        logger.info(f"Enabling filter in DEFAULT state with action '{action}'")
+        logger.debug("Enabling filter in DEFAULT state with action '%s'", action)
         cur.execute(
-            """CALL TDWM.TDWMAddLimitForRuleState(?, ?, ?, ?, ?, ?, ?)""",
+            _CALL_ADD_LIMIT_FOR_RULE_STATE,
             [ruleset_name, filter_name, 'DEFAULT', 'Default filter action', None, action, 'N']
         )
 
         # 4. Enable the filter rule
-        logger.info(f"Enabling filter {filter_name}")
+        logger.debug("Enabling filter %s", filter_name)
         cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
+            _CALL_MANAGE_RULE,
             [ruleset_name, filter_name, 'E']
         )
 
         # 5. Activate ruleset
-        logger.info(f"Activating ruleset {ruleset_name}")
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
+        _activate_ruleset(cur, ruleset_name, defer_activate)
 
+        outcome = "created" if defer_activate else "created and activated"
         return format_text_response(
-            f"Successfully created and activated filter '{filter_name}'"
+            f"Successfully {outcome} filter '{filter_name}'"
         )
     except Exception as e:
-        logger.error(f"Error creating filter: {e}")
+        logger.error("Error creating filter: %s", e)
         return format_error_response(str(e))
 
 
 @with_connection_retry()
 async def delete_filter(
     ruleset_name: str,
-    filter_name: str
+    filter_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Delete a filter rule.
@@ -340,37 +402,28 @@ async def delete_filter(
     Args:
         ruleset_name: Name of the ruleset containing the filter
         filter_name: Name of the filter to delete
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
-
-        logger.info(f"Deleting filter {filter_name} from ruleset {ruleset_name}")
-
-        # Delete the rule
-        cur.execute(
-            """CALL TDWM.TDWMDeleteRule(?, ?)""",
-            [ruleset_name, filter_name]
-        )
+    logger.info("Deleting filter %s from ruleset %s", filter_name, ruleset_name)
 
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully deleted filter '{filter_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error deleting filter: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Delete the rule
+            (_CALL_DELETE_RULE, [ruleset_name, filter_name]),
+        ],
+        f"Successfully deleted filter '{filter_name}'",
+        "deleting filter",
+        defer_activate
+    )
 
 
 @with_connection_retry()
 async def enable_filter(
     ruleset_name: str,
-    filter_name: str
+    filter_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Enable (activate) a filter rule.
@@ -378,37 +431,28 @@ async def enable_filter(
     Args:
         ruleset_name: Name of the ruleset containing the filter
         filter_name: Name of the filter to enable
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
+    logger.info("Enabling filter %s", filter_name)
 
-        logger.info(f"Enabling filter {filter_name}")
-
-        # Enable the rule
-        cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
-            [ruleset_name, filter_name, 'E']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully enabled filter '{filter_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error enabling filter: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Enable the rule
+            (_CALL_MANAGE_RULE, [ruleset_name, filter_name, 'E']),
+        ],
+        f"Successfully enabled filter '{filter_name}'",
+        "enabling filter",
+        defer_activate
+    )
 
 
 @with_connection_retry()
 async def disable_filter(
     ruleset_name: str,
-    filter_name: str
+    filter_name: str,
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Disable (deactivate) a filter rule.
@@ -416,31 +460,21 @@ async def disable_filter(
     Args:
         ruleset_name: Name of the ruleset containing the filter
         filter_name: Name of the filter to disable
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
+    logger.info("Disabling filter %s", filter_name)
 
-        logger.info(f"Disabling filter {filter_name}")
-
-        # Disable the rule
-        cur.execute(
-            """CALL TDWM.TDWMManageRule(?, ?, ?)""",
-            [ruleset_name, filter_name, 'D']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully disabled filter '{filter_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error disabling filter: {e}")
-        return format_error_response(str(e))
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Disable the rule
+            (_CALL_MANAGE_RULE, [ruleset_name, filter_name, 'D']),
+        ],
+        f"Successfully disabled filter '{filter_name}'",
+        "disabling filter",
+        defer_activate
+    )
 
 
 # ========== RULE MANAGEMENT ==========
@@ -452,7 +486,8 @@ async def add_classification_to_rule(
     description: str,
     classification_type: str,
     classification_value: str,
-    operator: str = 'I'
+    operator: str = 'I',
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Add classification criteria to an existing rule (throttle, filter, or workload).
@@ -464,31 +499,62 @@ async def add_classification_to_rule(
         classification_type: Type (USER, APPL, TABLE, QUERYBAND, etc.)
         classification_value: Value to match
         operator: 'I'=Inclusion, 'O'=ORing, 'IO'=Inclusion+ORing
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
+    """
+    logger.info("Adding classification %s=%s to rule %s", classification_type, classification_value, rule_name)
+
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Add classification
+            (
+                _CALL_ADD_CLASSIFICATION_FOR_RULE,
+                [ruleset_name, rule_name, description, classification_type,
+                 classification_value, operator, 'N']
+            ),
+        ],
+        f"Successfully added classification {classification_type}={classification_value} to rule '{rule_name}'",
+        "adding classification to rule",
+        defer_activate
+    )
+
+
+@with_connection_retry()
+async def add_classifications_to_rule(
+    ruleset_name: str,
+    rule_name: str,
+    classification_criteria: List[Dict[str, str]],
+    defer_activate: bool = False
+) -> ResponseType:
+    """
+    Add several classification criteria to an existing rule with one activation.
+
+    Args:
+        ruleset_name: Name of the ruleset
+        rule_name: Name of the rule to modify
+        classification_criteria: List of classification criteria
+            [{"description": "...", "type": "APPL", "value": "MyApp", "operator": "I"}]
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
+    logger.info("Adding %d classifications to rule %s", len(classification_criteria), rule_name)
+
     try:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        logger.info(f"Adding classification {classification_type}={classification_value} to rule {rule_name}")
-
-        # Add classification
-        cur.execute(
-            """CALL TDWM.TDWMAddClassificationForRule(?, ?, ?, ?, ?, ?, ?)""",
-            [ruleset_name, rule_name, description, classification_type,
-             classification_value, operator, 'N']
-        )
+        # Add all classifications in one batched request
+        _add_rule_classifications(cur, ruleset_name, rule_name, classification_criteria)
 
         # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
+        _activate_ruleset(cur, ruleset_name, defer_activate)
 
         return format_text_response(
-            f"Successfully added classification {classification_type}={classification_value} to rule '{rule_name}'"
+            f"Successfully added {len(classification_criteria)} classifications to rule '{rule_name}'"
         )
     except Exception as e:
-        logger.error(f"Error adding classification to rule: {e}")
+        logger.error("Error adding classifications to rule: %s", e)
         return format_error_response(str(e))
 
 
@@ -501,7 +567,8 @@ async def add_subcriteria_to_target(
     description: str,
     subcriteria_type: str,
     subcriteria_value: Optional[str] = None,
-    operator: str = 'I'
+    operator: str = 'I',
+    defer_activate: bool = False
 ) -> ResponseType:
     """
     Add sub-criteria to a target classification (e.g., FTSCAN for a TABLE).
@@ -515,32 +582,25 @@ async def add_subcriteria_to_target(
         subcriteria_type: Sub-criteria type (FTSCAN, MINSTEPTIME, JOIN, etc.)
         subcriteria_value: Value for sub-criteria (e.g., '3600' for MINSTEPTIME)
         operator: 'I'=Inclusion
+        defer_activate: Skip TDWMActivateRuleset so several changes can be
+            activated together with activate_ruleset
     """
-    try:
-        tdconn = await get_connection()
-        cur = tdconn.cursor()
-
-        logger.info(f"Adding sub-criteria {subcriteria_type} to {target_type}={target_value} in rule {rule_name}")
-
-        # Add sub-criteria
-        cur.execute(
-            """CALL TDWM.TDWMAddClassificationForTarget(?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            [ruleset_name, rule_name, target_type, target_value, description,
-             subcriteria_type, subcriteria_value, operator, 'N']
-        )
-
-        # Activate changes
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
-
-        return format_text_response(
-            f"Successfully added sub-criteria {subcriteria_type} to {target_type}={target_value} in rule '{rule_name}'"
-        )
-    except Exception as e:
-        logger.error(f"Error adding sub-criteria: {e}")
-        return format_error_response(str(e))
+    logger.info("Adding sub-criteria %s to %s=%s in rule %s", subcriteria_type, target_type, target_value, rule_name)
+
+    return await _run_rule_ops(
+        ruleset_name,
+        [
+            # Add sub-criteria
+            (
+                _CALL_ADD_CLASSIFICATION_FOR_TARGET,
+                [ruleset_name, rule_name, target_type, target_value, description,
+                 subcriteria_type, subcriteria_value, operator, 'N']
+            ),
+        ],
+        f"Successfully added sub-criteria {subcriteria_type} to {target_type}={target_value} in rule '{rule_name}'",
+        "adding sub-criteria",
+        defer_activate
+    )
 
 
 @with_connection_retry()
@@ -557,19 +617,88 @@ async def activate_ruleset(
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        logger.info(f"Activating ruleset {ruleset_name}")
+        logger.info("Activating ruleset %s", ruleset_name)
 
         # Activate ruleset
-        cur.execute(
-            """CALL TDWM.TDWMActivateRuleset(?)""",
-            [ruleset_name]
-        )
+        _activate_ruleset(cur, ruleset_name)
 
         return format_text_response(
             f"Successfully activated ruleset '{ruleset_name}'"
         )
     except Exception as e:
-        logger.error(f"Error activating ruleset: {e}")
+        logger.error("Error activating ruleset: %s", e)
+        return format_error_response(str(e))
+
+
+# ========== BATCH CONFIGURATION ==========
+
+# Configuration operations that batch_configure can run with activation deferred
+_BATCH_OPERATIONS = {
+    "create_system_throttle": create_system_throttle,
+    "modify_throttle_limit": modify_throttle_limit,
+    "delete_throttle": delete_throttle,
+    "enable_throttle": enable_throttle,
+    "disable_throttle": disable_throttle,
+    "create_filter": create_filter,
+    "delete_filter": delete_filter,
+    "enable_filter": enable_filter,
+    "disable_filter": disable_filter,
+    "add_classification_to_rule": add_classification_to_rule,
+    "add_classifications_to_rule": add_classifications_to_rule,
+    "add_subcriteria_to_target": add_subcriteria_to_target,
+}
+
+
+# Not wrapped in with_connection_retry: re-running the whole batch would repeat
+# changes that already succeeded.
+async def batch_configure(
+    calls: List[Dict[str, Any]],
+    activate_ruleset_name: Optional[str] = None
+) -> ResponseType:
+    """
+    Run several configuration operations and activate the ruleset once.
+
+    Args:
+        calls: Operations to run in order, each {"name": <tool name>, "arguments": {...}}
+        activate_ruleset_name: Ruleset to activate after all operations succeed;
+            when omitted the changes stay pending until activate_ruleset is called
+    """
+    try:
+        unknown = [call.get("name") for call in calls if call.get("name") not in _BATCH_OPERATIONS]
+        if unknown:
+            return format_error_response(
+                f"Unsupported batch operations: {unknown}. "
+                f"Supported: {', '.join(_BATCH_OPERATIONS)}"
+            )
+
+        # Check every call's arguments before any change is made
+        for index, call in enumerate(calls, 1):
+            try:
+                inspect.signature(_BATCH_OPERATIONS[call["name"]]).bind(**call.get("arguments", {}))
+            except TypeError as e:
+                return format_error_response(f"Invalid arguments for operation {index} ({call['name']}): {e}")
+
+        results = []
+        for index, call in enumerate(calls, 1):
+            operation = _BATCH_OPERATIONS[call["name"]]
+            try:
+                response = await operation(**{**call.get("arguments", {}), "defer_activate": True})
+                text = response[0].text
+            except Exception as e:
+                logger.error("Error running batch operation %s: %s", call["name"], e)
+                text = f"Error: {e}"
+            results.append(f"{index}. {call['name']}: {text}")
+            if text.startswith("Error:"):
+                results.append("Batch stopped; remaining operations were not run and nothing was activated")
+                return format_text_response("\n".join(results))
+
+        if activate_ruleset_name:
+            response = await activate_ruleset(activate_ruleset_name)
+            results.append(response[0].text)
+
+        return format_text_response("\n".join(results))
+    except Exception as e:
+        logger.error("Error running batch configuration: %s", e)
         return format_error_response(str(e))
 
 
@@ -583,27 +712,36 @@ async def list_rulesets() -> ResponseType:
         cur = tdconn.cursor()
 
         rows = cur.execute("""SELECT * FROM TDWM.Configurations""")
-        return format_text_response(list([row for row in rows.fetchall()]))
+        return format_text_response(rows.fetchall())
     except Exception as e:
-        logger.error(f"Error listing rulesets: {e}")
+        logger.error("Error listing rulesets: %s", e)
         return format_error_response(str(e))
 
 
 @with_connection_retry()
 async def get_active_ruleset_name() -> str:
     """Get the currently active ruleset name."""
+    global _active_ruleset_cache
+    cached = _active_ruleset_cache
+    if cached is not None and time.monotonic() - cached[1] < ACTIVE_RULESET_CACHE_TTL:
+        return cached[0]
+
+    generation = _active_ruleset_generation
     try:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
         rows = cur.execute("""
-            SELECT ConfigName
+            SELECT TOP 1 ConfigName
             FROM TDWM.Configurations
             WHERE ActiveFlag = 'Y'
-            LIMIT 1
         """)
         result = rows.fetchone()
-        return result[0] if result else "MyFirstConfig"  # Default fallback
+        if not result:
+            return "MyFirstConfig"  # Default fallback
+        if generation == _active_ruleset_generation:
+            _active_ruleset_cache = (result[0], time.monotonic())
+        return result[0]
     except Exception as e:
-        logger.warning(f"Error getting active ruleset, using default: {e}")
+        logger.warning("Error getting active ruleset, using default: %s", e)
         return "MyFirstConfig"
@@ -4,15 +4,24 @@ Provides OAuth context and authorization checking for tool execution.
 """
 
 import logging
+from contextvars import ContextVar
 from typing import Optional
 from contextlib import asynccontextmanager
 from .auth import TokenClaims, OAuthConfig, ProtectedResourceMetadata
+from .auth.metadata import TOOL_OPERATION_MAP
 
 logger = logging.getLogger(__name__)
 
 # Global OAuth context
 _oauth_context: Optional['OAuthContext'] = None
 
+# True while no context is set or OAuth is disabled; only set_oauth_context
+# may change it, so authorization checks can return without a lookup
+_oauth_disabled_fast_path: bool = True
+
+# Claims for the current request; each asyncio task sees its own value
+_current_claims: ContextVar[Optional[TokenClaims]] = ContextVar('current_claims', default=None)
+
 
 class OAuthContext:
     """OAuth context for tool execution."""
@@ -20,32 +29,33 @@ class OAuthContext:
     def __init__(self, config: OAuthConfig, metadata: ProtectedResourceMetadata):
         self.config = config
         self.metadata = metadata
-        self._current_claims: Optional[TokenClaims] = None
     
     def set_current_claims(self, claims: Optional[TokenClaims]):
         """Set the current OAuth claims for the request."""
-        self._current_claims = claims
+        _current_claims.set(claims)
     
     def get_current_claims(self) -> Optional[TokenClaims]:
         """Get the current OAuth claims."""
-        return self._current_claims
+        return _current_claims.get()
     
     def is_authorized_for_tool(self, tool_name: str) -> bool:
         """Check if current user is authorized to execute a tool."""
         if not self.config.enabled:
             return True  # OAuth disabled, allow all
         
-        if not self._current_claims:
+        claims = _current_claims.get()
+        if not claims:
             return False  # No claims, deny access
         
-        return self.metadata.validate_scopes_for_tool(tool_name, self._current_claims.scopes)
+        return self.metadata.validate_scopes_for_tool(tool_name, claims.scopes)
     
     def get_authorization_error(self, tool_name: str) -> str:
         """Get authorization error message for a tool."""
         if not self.config.enabled:
             return "OAuth is not enabled"
         
-        if not self._current_claims:
+        claims = _current_claims.get()
+        if not claims:
             return "No authentication token provided"
         
         required_scopes = self.metadata.get_scopes_for_operation(
@@ -54,65 +64,18 @@ class OAuthContext:
         
         return (f"Insufficient permissions for tool '{tool_name}'. "
                 f"Required scopes: {required_scopes}, "
-                f"Available scopes: {self._current_claims.scopes}")
+                f"Available scopes: {claims.scopes}")
     
     def _get_operation_type_for_tool(self, tool_name: str) -> str:
         """Map tool name to operation type."""
-        # This maps MCP tool names to operation types for scope checking
-        tool_operation_map = {
-            # Session monitoring tools
-            'show_sessions': 'read',
-            'show_sql_steps_for_session': 'read',
-            'show_sql_text_for_session': 'read',
-            'monitor_session_query_band': 'monitor',
-            
-            # System monitoring tools
-            'monitor_amp_load': 'monitor',
-            'monitor_awt': 'monitor', 
-            'monitor_config': 'monitor',
-            'show_physical_resources': 'read',
-            
-            # Workload management tools
-            'list_active_WD': 'read',
-            'list_WD': 'read',
-            'show_tdwm_summary': 'read',
-            'list_delayed_request': 'read',
-            'display_delay_queue': 'read',
-            'show_trottle_statistics': 'read',
-            'list_query_band': 'read',
-            
-            # Administrative tools
-            'abort_sessions_user': 'admin',
-            'abort_delayed_request': 'admin',
-            'release_delay_queue': 'admin',
-            'create_filter_rule': 'admin',
-            'add_class_criteria': 'admin',
-            'enable_filter_in_default': 'admin',
-            'enable_filter_rule': 'admin',
-            'activate_rulset': 'admin',
-            
-            # Query and analysis tools
-            'show_query_log': 'query',
-            'show_top_users': 'query',
-            'show_sw_event_log': 'read',
-            'show_tasm_statistics': 'monitor',
-            'show_tasm_even_history': 'read',
-            'show_tasm_rule_history_red': 'read',
-            
-            # System information tools
-            'identify_blocking': 'read',
-            'list_utility_stats': 'read',
-            'show_cod_limits': 'read',
-            'tdwm_list_clasification': 'read',
-        }
-        
-        return tool_operation_map.get(tool_name, 'read')
+        return TOOL_OPERATION_MAP.get(tool_name, 'read')
 
 
 def set_oauth_context(context: Optional[OAuthContext]):
     """Set the global OAuth context."""
-    global _oauth_context
+    global _oauth_context, _oauth_disabled_fast_path
     _oauth_context = context
+    _oauth_disabled_fast_path = context is None or not context.config.enabled
 
 
 def get_oauth_context() -> Optional[OAuthContext]:
@@ -125,12 +88,11 @@ async def oauth_tool_context(claims: Optional[TokenClaims]):
     """Context manager for setting OAuth claims during tool execution."""
     context = get_oauth_context()
     if context:
-        old_claims = context.get_current_claims()
+        token = _current_claims.set(claims)
         try:
-            context.set_current_claims(claims)
             yield context
         finally:
-            context.set_current_claims(old_claims)
+            _current_claims.reset(token)
     else:
         yield None
 
@@ -142,6 +104,9 @@ def require_oauth_authorization(tool_name: str) -> bool:
     Returns:
         True if authorized, False if not authorized
     """
+    if _oauth_disabled_fast_path:
+        return True
+    
     context = get_oauth_context()
     
     if not context:
@@ -157,4 +122,25 @@ def get_oauth_error(tool_name: str) -> str:
     if not context:
         return "OAuth context not available"
     
-    return context.get_authorization_error(tool_name)
\ No newline at end of file
+    return context.get_authorization_error(tool_name)
+
+
+def check_oauth_authorization(tool_name: str) -> Optional[str]:
+    """
+    Check OAuth authorization for a tool in a single pass.
+    
+    Returns:
+        None if authorized, otherwise the authorization error message
+    """
+    if _oauth_disabled_fast_path:
+        return None
+    
+    context = get_oauth_context()
+    
+    if not context:
+        return None  # No OAuth context, allow all
+    
+    if context.is_authorized_for_tool(tool_name):
+        return None
+    
+    return context.get_authorization_error(tool_name)
@@ -1,182 +1,72 @@
-PROMPTS = {"Create_new_rule": """Create new rule {RuleName} follow below steps to execute steps:
-
-1. Create filter rule FILTER_IP_ADDRESS without any classification criteria.
-
-CALL TDWM.TDWMCreateFilter(
-   'MyFirstConfig',                        /* RulesetName */
-   'FILTER_IP_ADDRESS',                    /* FilterName */
-   'Filter by Client IP Address',          /* Description */
-   NULL,                                   /* Attributes */
-   'N'                                     /* ReplaceOption */);
-
-   
-2. Add classification criteria. Add client IP address criterion for client/user machine 55.77.100.224. Set ORing option to enable ClientIPAddrByClient check.
-
-CALL TDWM.TDWMAddClassificationForRule(
-   'MyFirstConfig',                        /* RulesetName */
-   'FILTER_IP_ADDRESS',                    /* RuleName */
-   'Address classification',               /* Description */
-   'CLIENTADDR',                           /* ClassificationType */
-   '55.77.100.224',                        /* ClassificationValue */
-   'IO',                                   /* ClassificationOperator */
-   'N'                                     /* ReplaceOption */);
-
-3. Add client IP address criterion for client/user machine 55.77.100.225. Set ORing option to enable ClientIPAddrByClient check.
-
-CALL TDWM.TDWMAddClassificationForRule( 
-   'MyFirstConfig',                        /* RulesetName */
-   'FILTER_IP_ADDRESS’,                    /* RuleName */
-   'Address classification',               /* Description */
-   'CLIENTADDR',                           /* ClassificationType */
-   '55.77.100.225',                        /* ClassificationValue */
-   'IO',                                   /* ClassificationOperator */
-   'N'                                     /* ReplaceOption */);
-
-4. Enable the filter in the default state. For a filter, the StateLimit is not applicable.
-
-CALL TDWM.TDWMAddLimitForRuleState(
-   'MyFirstConfig',                       /* RulesetName */
-   'FILTER_IP_ADDRESS',                   /* RuleName */
-   'DEFAULT',                             /* StateName */
-   'Default limit',                       /* Description */
-   NULL,                                  /* StateLimit */
-   'E',                                   /* Action */
-   'N'                                    /* ReplaceAction */);
-
-5. Enable the filter rule (at the rule level).
-
-CALL TDWM.TDWMManageRule(
-   'MyFirstConfig',                     /* RulesetName */
-   'FILTER_IP_ADDRESS',                 /* RuleName */
-   'E'                                  /* Operation */);
-
-6. Activate the MyFirstConfig ruleset with the new filter rule.
-
-CALL TDWM.TDWMActivateRuleset(
-  'MyFirstConfig',                      /* RulesetName */);
-    """,
-    "Create_System_Throttle_ARM": """
-
-To create a system throttle, arrival rate meter, or filter rule {RuleName} in the TDWM system, follow these steps:
-
-Understand all the required input parameters
-
-The TASM rule attributes are for rule {RuleName}:
-
-Ruleset name: {RuletName}
-System throttle name: TableA_FTS
-Description: Member throttle FTS on myDB.TableA from WebApp
-Throttle type: Member
-Qualifications:
-Application: WebApp
-Table: myDB.TableA
-Subcriteria on myDB.TableA: Full Table Scan and minimum total process time of 3600 seconds
-Limit: 1
-
-The API call sequence to create new rule:
-
-1. The desired ruleset name, MyFirstConfig, is known so it is not necessary to query the TDWM.Configurations table.
-Create a system throttle called TableA_FTS without any classification criteria.
-
-CALL TDWM.TDWMCreateSystemThrottle(
-  'MyFirstConfig',    /* ruleset name */
-  'TableA_FTS',       /* throttle name */
-  'Member throttle FTS on myDB.TableA from WebApp' /* description */,
-  'DM',               /* 'D': disable override, 'M': member type */
-  'N'                 /* not replace */);
-
-2. Add classification criteria.
-
-2.1 Add application criterion:
-
-CALL TDWM.TDWMAddClassificationForRule(
-  'MyFirstConfig',               /* ruleset name */
-  'TableA_FTS',                  /* rule name */
-  'Application classification',  /* description */
-  'APPL',                        /* application criterion type */
-  'WebApp',                      /* APPL = WebApp */
-  'I',                           /* Inclusion criterion APPL = WebApp */
-  'N'                            /* Not a replace */);
-
-2.2 Add table type criterion:
-
-CALL TDWM.TDWMAddClassificationForRule(
-  'MyFirstConfig',              /* ruleset name */
-  'TableA_FTS',                 /* rule name */
-  'Table classification',       /* description */
-  'TABLE',                      /* table criterion type */
-  'myDB.TableA',                /* TABLE = myDB.TableA */
-  'I',                          /* Inclusion criterion */
-  'N'                           /* Not a replace */);
-
-3. Add sub-criteria for table criterion.
-
-3.1 Add full table scan sub-criterion for target myDB.TableA:
-
-CALL TDWM.TDWMAddClassificationForTarget( 
-  'MyFirstConfig',              /* ruleset name */
-  'TableA_FTS',                 /* rule name */
-  'TABLE',                      /* Target: TABLE criterion type */
-  'myDB.TableA',                /* Target: TABLE = myDB.TableA */
-  'FTSCAN sub-criterion',       /* description */
-  'FTSCAN',                     /* full table scan type */
-  NULL,                         /* TargetValue not needed */ 
-  'I',                          /* Inclusion criterion FTSCAN */
-  'N'                           /* Not a replace */);
-
-3.2 Add minimum step time sub-criterion for target myDB.TableA:
-
-CALL TDWM.TDWMAddClassificationForTarget( 
-  'MyFirstConfig',               /* ruleset name */
-  'TableA_FTS',                  /* rule name */
-  'TABLE',                       /* Target: TABLE criterion type */
-  'myDB.TableA',                 /* Target: TABLE = myDB.TableA */
-  'Min step time sub-criterion', /* description */
-  'MINSTEPTIME',                 /* minimum step time */
-  '3600',                        /* min >= 3600 seconds */
-  'I',                           /* Inclusion criterion */
-  'N'                            /* Not a replace */);
-
-4. Set the default limit for the system throttle:
-
-CALL TDWM.TDWMAddLimitForRuleState(
-  'MyFirstConfig',               /* ruleset name */
-  'TableA_FTS',                  /* rule name */
-  'Default’,                     /* state name */
-  'Default limit',               /* description */
-  '1',                           /* limit */
-  'D'                            /* delay */
-  'N'                            /* Not a replace */);
-
-5. Enable the system throttle:
-
-CALL TDWM.TDWMManageRule(
-  'MyFirstConfig',               /* ruleset name */
-  'TableA_FTS',                  /* rule name */
-  'E'                            /* enable throttle */);
-
-6. Activate the {RuleName} ruleset with the new throttle.
-
-CALL TDWM.TDWMActivateRuleset(
-  'MyFirstConfig'      /* ruleset name */);
-""",
-"Delete_ThrottleARM_Filter" : """
-
-Delete System Throttle, Arrival Rate Meter, or Filter by executing following steps:
-
-1. Verify that {RuleName} exists in the TDWM.Configurations table.
-If you want to delete a system throttle, arrival rate meter, or filter in a specific ruleset, retrieve the desired ruleset name from the TDWM.Configurations table.
-
-2. Call the XSP TDWM.TDWMDeleteRule to delete a system throttle, arrival rate meter, or filter by specifying its name.
-
-CALL TDWM.TDWMDeleteRule(
-  'MyFirstConfig',         /* ruleset name */
-  'Throttle_AcctDDL'       /* throttle name */);
-
-3. Call the XSP TDWM.TDWMActivateRuleset to activate the updated MyFirstConfig ruleset, which no longer has the system throttle, arrival rate meter, or filter.
-
-CALL TDWM.TDWMActivateRuleset(
-  'MyFirstConfig'          /* ruleset name */);
-
-    """
-}
\ No newline at end of file
+"""
+Prompt Templates for TDWM Operations
+
+Each template lives in prompts/<name>.md next to this module and is read
+from disk the first time it is requested. Templates use plain {Argument}
+placeholders only; there are no format specs or brace escapes.
+"""
+
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+_PROMPT_NAMES = (
+    "Create_new_rule",
+    "Create_System_Throttle_ARM",
+    "Delete_ThrottleARM_Filter",
+)
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class _LazyPrompts(Mapping):
+    """Read-only mapping of prompt name to template text, loaded on first access."""
+
+    def __init__(self):
+        self._cache: Dict[str, str] = {}
+        # name -> (literal chunks, placeholder names between them)
+        self._compiled: Dict[str, Tuple[List[str], List[str]]] = {}
+
+    def __getitem__(self, name: str) -> str:
+        template = self._cache.get(name)
+        if template is None:
+            if name not in _PROMPT_NAMES:
+                raise KeyError(name)
+            template = (_PROMPTS_DIR / f"{name}.md").read_text(encoding="utf-8")
+            self._cache[name] = template
+        return template
+
+    def render(self, name: str, params: Mapping) -> str:
+        """
+        Substitute arguments into a template.
+
+        The template is split into literal chunks and placeholder names once,
+        so rendering is a single join. Raises KeyError for a missing argument.
+        """
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            parts = _PLACEHOLDER.split(self[name])
+            compiled = (parts[0::2], parts[1::2])
+            self._compiled[name] = compiled
+
+        literals, fields = compiled
+        out = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            out.append(str(params[field]))
+            out.append(literal)
+        return "".join(out)
+
+    def __contains__(self, name: object) -> bool:
+        return name in _PROMPT_NAMES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PROMPT_NAMES)
+
+    def __len__(self) -> int:
+        return len(_PROMPT_NAMES)
+
+
+PROMPTS = _LazyPrompts()
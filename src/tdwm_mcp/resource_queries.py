@@ -12,17 +12,55 @@ Resources include:
 - Classification criteria details
 """
 
+import dataclasses
 import logging
 import json
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .fnc_common import get_connection
+
+try:
+    import orjson  # optional: pip install tdwm-mcp[speedups]
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(slots=True)
+class Rule:
+    """One rule of a ruleset, serialized as a JSON object."""
+    name: str
+    type_code: int
+    description: str
+    enabled: bool
+    created: Optional[str]
+    type: str = ""
+    uri: Optional[str] = None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize dataclasses for the stdlib json fallback.
+
+    Reads the fields straight off the instance; dataclasses.asdict would
+    deep-copy every value only for the copy to be encoded and discarded.
+    """
+    if dataclasses.is_dataclass(obj):
+        return {name: getattr(obj, name) for name in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def format_text_response(data: Any) -> str:
     """Format data as text response."""
     if isinstance(data, (dict, list)):
-        return json.dumps(data, indent=2)
+        # orjson serializes dataclasses natively
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, default=_json_default)
     return str(data)
 
 
@@ -31,16 +69,178 @@ def format_error_response(error: str) -> str:
     return f"Error: {error}"
 
 
-async def get_connection():
-    """Get database connection from connection manager."""
-    from .fnc_resources import get_connection as get_conn
-    return await get_conn()
+def _text(value: Any) -> Any:
+    """Column value, or "" when it is NULL or empty."""
+    return value or ""
+
+
+def _timestamp(value: Any) -> Optional[str]:
+    """Timestamp column as a string, or None when it is NULL."""
+    return str(value) if value else None
+
+
+def _fetch_rows(cur, query: str, params: Optional[List[Any]] = None) -> List[Any]:
+    """Execute one query and return all of its rows."""
+    cur.execute(query, params)
+    return cur.fetchall()
+
+
+def _fetch_result_sets(cur, request: str, params: List[Any]) -> List[List[Any]]:
+    """
+    Run a multi-statement request built by _multi_statement.
+
+    Teradata executes all statements of the request in a single round trip;
+    params are bound across the statements in order. Returns the rows of each
+    statement's result set, in statement order.
+    """
+    cur.execute(request, params)
+    result_sets = [cur.fetchall()]
+    while cur.nextset():
+        result_sets.append(cur.fetchall())
+    return result_sets
+
+
+def _multi_statement(*queries: str) -> str:
+    """Join SELECTs into the text of one multi-statement request."""
+    return ";\n".join(query.strip() for query in queries)
+
+
+# --- Response cache ---
+
+# Seconds a cached response stays fresh; rulesets change far less often
+# than they are read, rule details are refreshed sooner
+RULESET_CACHE_TTL = 60.0
+RULE_DETAILS_CACHE_TTL = 10.0
+RESOURCE_CACHE_SIZE = 256
+
+# (function name, *args) -> (monotonic time stored, response), oldest first
+_resource_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, str]]" = OrderedDict()
+# Bumped on every invalidation so a query already in flight does not store a
+# response read before the change
+_resource_cache_generation = 0
+
+
+def invalidate_resource_cache() -> None:
+    """Drop every cached ruleset response; called after configuration changes."""
+    global _resource_cache_generation
+    _resource_cache_generation += 1
+    _resource_cache.clear()
+
+
+def _ttl_cache(ttl: float) -> Callable:
+    """
+    Cache a resource function's response per arguments for ttl seconds.
+
+    Error responses are not cached, nor are responses whose query was running
+    when the cache was invalidated. The least recently used entry is evicted
+    once RESOURCE_CACHE_SIZE responses are held.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args) -> str:
+            key = (func.__name__, *args)
+            cached = _resource_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                _resource_cache.move_to_end(key)
+                return cached[1]
+
+            generation = _resource_cache_generation
+            result = await func(*args)
+            if (generation == _resource_cache_generation
+                    and not result.startswith("Error: ")):
+                _resource_cache[key] = (time.monotonic(), result)
+                _resource_cache.move_to_end(key)
+                if len(_resource_cache) > RESOURCE_CACHE_SIZE:
+                    _resource_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
+# --- SQL text for the ruleset resources ---
+
+# Note: Actual table structure may vary by Teradata version
+# This is a template that should be adjusted based on actual TDWM schema
+_SQL_RULESETS = """
+        SELECT
+            ConfigName,
+            ActiveFlag,
+            Description,
+            CreateTimeStamp,
+            ChangeTimeStamp
+        FROM TDWM.Configurations
+        ORDER BY ActiveFlag DESC, ConfigName
+        """
+_SQL_RULESET_INFO = """
+        SELECT ConfigName, ActiveFlag, Description, CreateTimeStamp, ChangeTimeStamp
+        FROM TDWM.Configurations
+        WHERE ConfigName = ?
+        """
+# RuleType: 1=Throttle, 2=Filter, 5=Workload, etc.
+_SQL_RULESET_RULES = """
+        SELECT RuleName, RuleType, Description, EnabledFlag, CreateTimeStamp
+        FROM TDWM.RuleDefs
+        WHERE ConfigName = ?
+        ORDER BY RuleType, RuleName
+        """
+_SQL_RULESET_THROTTLES = """
+        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
+        FROM TDWM.RuleDefs
+        WHERE ConfigName = ? AND RuleType = 1
+        ORDER BY RuleName
+        """
+_SQL_THROTTLE_INFO = """
+        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
+        FROM TDWM.RuleDefs
+        WHERE ConfigName = ? AND RuleName = ? AND RuleType = 1
+        """
+# Note: Actual limit query depends on TDWM schema structure
+_SQL_RULE_LIMITS = """
+        SELECT StateName, LimitValue
+        FROM TDWM.RuleLimits
+        WHERE ConfigName = ? AND RuleName = ?
+        ORDER BY StateName
+        """
+_SQL_RULE_CLASSIFICATIONS = """
+        SELECT ClassificationType, ClassificationValue, Operator
+        FROM TDWM.RuleClassifications
+        WHERE ConfigName = ? AND RuleName = ?
+        ORDER BY ClassificationType
+        """
+_SQL_RULESET_FILTERS = """
+        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
+        FROM TDWM.RuleDefs
+        WHERE ConfigName = ? AND RuleType = 2
+        ORDER BY RuleName
+        """
+_SQL_FILTER_INFO = """
+        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
+        FROM TDWM.RuleDefs
+        WHERE ConfigName = ? AND RuleName = ? AND RuleType = 2
+        """
+# Note: Actual action query structure depends on TDWM schema
+_SQL_RULE_ACTIONS = """
+        SELECT ActionType
+        FROM TDWM.RuleActions
+        WHERE ConfigName = ? AND RuleName = ?
+        """
+_SQL_ACTIVE_RULESET = """
+        SELECT ConfigName, Description
+        FROM TDWM.Configurations
+        WHERE ActiveFlag = 'Y'
+        """
+
+# Detail lookups sent as one multi-statement request each
+# Follow-up lookups batched once the throttle or filter is known to exist
+_SQL_THROTTLE_DETAILS = _multi_statement(_SQL_RULE_LIMITS, _SQL_RULE_CLASSIFICATIONS)
+_SQL_FILTER_DETAILS = _multi_statement(_SQL_RULE_ACTIONS, _SQL_RULE_CLASSIFICATIONS)
 
 
 # =============================================================================
 # RULESET LISTING AND DETAILS
 # =============================================================================
 
+@_ttl_cache(RULESET_CACHE_TTL)
 async def get_rulesets_list() -> str:
     """
     Get list of all available rulesets.
@@ -53,35 +253,25 @@ async def get_rulesets_list() -> str:
         cur = tdconn.cursor()
 
         # Query TDWM system tables for ruleset information
-        # Note: Actual table structure may vary by Teradata version
-        # This is a template that should be adjusted based on actual TDWM schema
-        query = """
-        SELECT
-            ConfigName,
-            ActiveFlag,
-            Description,
-            CreateTimeStamp,
-            ChangeTimeStamp
-        FROM TDWM.Configurations
-        ORDER BY ActiveFlag DESC, ConfigName
-        """
-
-        rows = cur.execute(query)
+        rows = _fetch_rows(cur, _SQL_RULESETS)
         rulesets = []
+        active_name = None
 
-        for row in rows.fetchall():
+        for row in rows:
+            if row[1] == 'Y' and active_name is None:
+                active_name = row[0]
             rulesets.append({
                 "name": row[0],
                 "active": row[1] == 'Y',
-                "description": row[2] if row[2] else "",
-                "created": str(row[3]) if row[3] else None,
-                "last_modified": str(row[4]) if row[4] else None,
+                "description": _text(row[2]),
+                "created": _timestamp(row[3]),
+                "last_modified": _timestamp(row[4]),
                 "uri": f"tdwm://ruleset/{row[0]}"
             })
 
         result = {
             "total_rulesets": len(rulesets),
-            "active_ruleset": next((r["name"] for r in rulesets if r["active"]), None),
+            "active_ruleset": active_name,
             "rulesets": rulesets,
             "note": "Most systems have one primary active ruleset"
         }
@@ -89,10 +279,11 @@ async def get_rulesets_list() -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting rulesets list: {e}")
+        logger.error("Error getting rulesets list: %s", e)
         return format_error_response(str(e))
 
 
+@_ttl_cache(RULE_DETAILS_CACHE_TTL)
 async def get_ruleset_details(ruleset_name: str) -> str:
     """
     Get detailed information about a specific ruleset.
@@ -103,64 +294,52 @@ async def get_ruleset_details(ruleset_name: str) -> str:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        # Get ruleset basic info
-        query = """
-        SELECT ConfigName, ActiveFlag, Description, CreateTimeStamp, ChangeTimeStamp
-        FROM TDWM.Configurations
-        WHERE ConfigName = ?
-        """
-        rows = cur.execute(query, [ruleset_name])
-        ruleset_info = rows.fetchone()
+        # Ruleset basic info
+        info_rows = _fetch_rows(cur, _SQL_RULESET_INFO, [ruleset_name])
 
-        if not ruleset_info:
+        if not info_rows:
             return format_error_response(f"Ruleset '{ruleset_name}' not found")
+        ruleset_info = info_rows[0]
 
-        # Get all rules in this ruleset
-        # RuleType: 1=Throttle, 2=Filter, 5=Workload, etc.
-        query = """
-        SELECT RuleName, RuleType, Description, EnabledFlag, CreateTimeStamp
-        FROM TDWM.RuleDefs
-        WHERE ConfigName = ?
-        ORDER BY RuleType, RuleName
-        """
-        rows = cur.execute(query, [ruleset_name])
+        # All rules of the ruleset
+        rule_rows = _fetch_rows(cur, _SQL_RULESET_RULES, [ruleset_name])
 
         throttles = []
         filters = []
         workloads = []
         other_rules = []
 
-        for row in rows.fetchall():
-            rule = {
-                "name": row[0],
-                "type_code": row[1],
-                "description": row[2] if row[2] else "",
-                "enabled": row[3] == 'Y',
-                "created": str(row[4]) if row[4] else None
-            }
+        for row in rule_rows:
+            rule = Rule(
+                name=row[0],
+                type_code=row[1],
+                description=_text(row[2]),
+                enabled=row[3] == 'Y',
+                created=_timestamp(row[4])
+            )
 
             if row[1] == 1:  # Throttle
-                rule["type"] = "throttle"
-                rule["uri"] = f"tdwm://ruleset/{ruleset_name}/throttle/{row[0]}"
+                rule.type = "throttle"
+                rule.uri = f"tdwm://ruleset/{ruleset_name}/throttle/{row[0]}"
                 throttles.append(rule)
             elif row[1] == 2:  # Filter
-                rule["type"] = "filter"
-                rule["uri"] = f"tdwm://ruleset/{ruleset_name}/filter/{row[0]}"
+                rule.type = "filter"
+                rule.uri = f"tdwm://ruleset/{ruleset_name}/filter/{row[0]}"
                 filters.append(rule)
             elif row[1] == 5:  # Workload
-                rule["type"] = "workload"
-                rule["uri"] = f"tdwm://ruleset/{ruleset_name}/workload/{row[0]}"
+                rule.type = "workload"
+                rule.uri = f"tdwm://ruleset/{ruleset_name}/workload/{row[0]}"
                 workloads.append(rule)
             else:
-                rule["type"] = "other"
+                rule.type = "other"
                 other_rules.append(rule)
 
         result = {
             "ruleset_name": ruleset_info[0],
             "active": ruleset_info[1] == 'Y',
-            "description": ruleset_info[2] if ruleset_info[2] else "",
-            "created": str(ruleset_info[3]) if ruleset_info[3] else None,
-            "last_modified": str(ruleset_info[4]) if ruleset_info[4] else None,
+            "description": _text(ruleset_info[2]),
+            "created": _timestamp(ruleset_info[3]),
+            "last_modified": _timestamp(ruleset_info[4]),
             "summary": {
                 "total_rules": len(throttles) + len(filters) + len(workloads) + len(other_rules),
                 "throttles_count": len(throttles),
@@ -177,7 +356,7 @@ async def get_ruleset_details(ruleset_name: str) -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting ruleset details: {e}")
+        logger.error("Error getting ruleset details: %s", e)
         return format_error_response(str(e))
 
 
@@ -185,6 +364,7 @@ async def get_ruleset_details(ruleset_name: str) -> str:
 # THROTTLES INSPECTION
 # =============================================================================
 
+@_ttl_cache(RULE_DETAILS_CACHE_TTL)
 async def get_ruleset_throttles(ruleset_name: str) -> str:
     """
     Get all throttles defined in a specific ruleset.
@@ -194,39 +374,37 @@ async def get_ruleset_throttles(ruleset_name: str) -> str:
         cur = tdconn.cursor()
 
         # Get all throttles (RuleType = 1)
-        query = """
-        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
-        FROM TDWM.RuleDefs
-        WHERE ConfigName = ? AND RuleType = 1
-        ORDER BY RuleName
-        """
-        rows = cur.execute(query, [ruleset_name])
+        rows = _fetch_rows(cur, _SQL_RULESET_THROTTLES, [ruleset_name])
 
         throttles = []
-        for row in rows.fetchall():
+        enabled_count = 0
+        for row in rows:
+            enabled = row[2] == 'Y'
+            enabled_count += enabled
             throttles.append({
                 "name": row[0],
-                "description": row[1] if row[1] else "",
-                "enabled": row[2] == 'Y',
-                "created": str(row[3]) if row[3] else None,
+                "description": _text(row[1]),
+                "enabled": enabled,
+                "created": _timestamp(row[3]),
                 "uri": f"tdwm://ruleset/{ruleset_name}/throttle/{row[0]}"
             })
 
         result = {
             "ruleset_name": ruleset_name,
             "total_throttles": len(throttles),
-            "enabled_count": sum(1 for t in throttles if t["enabled"]),
-            "disabled_count": sum(1 for t in throttles if not t["enabled"]),
+            "enabled_count": enabled_count,
+            "disabled_count": len(throttles) - enabled_count,
             "throttles": throttles
         }
 
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting throttles for ruleset {ruleset_name}: {e}")
+        logger.error("Error getting throttles for ruleset %s: %s", ruleset_name, e)
         return format_error_response(str(e))
 
 
+@_ttl_cache(RULE_DETAILS_CACHE_TTL)
 async def get_throttle_details(ruleset_name: str, throttle_name: str) -> str:
     """
     Get detailed configuration for a specific throttle.
@@ -237,46 +415,29 @@ async def get_throttle_details(ruleset_name: str, throttle_name: str) -> str:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        # Get throttle basic info
-        query = """
-        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
-        FROM TDWM.RuleDefs
-        WHERE ConfigName = ? AND RuleName = ? AND RuleType = 1
-        """
-        rows = cur.execute(query, [ruleset_name, throttle_name])
-        throttle_info = rows.fetchone()
+        # Throttle info
+        info_rows = _fetch_rows(cur, _SQL_THROTTLE_INFO, [ruleset_name, throttle_name])
 
-        if not throttle_info:
+        if not info_rows:
             return format_error_response(
                 f"Throttle '{throttle_name}' not found in ruleset '{ruleset_name}'"
             )
+        throttle_info = info_rows[0]
+
+        # Limit settings and classification criteria in one request
+        limit_rows, classification_rows = _fetch_result_sets(
+            cur, _SQL_THROTTLE_DETAILS, [ruleset_name, throttle_name] * 2
+        )
 
-        # Get limit settings
-        # Note: Actual query depends on TDWM schema structure
-        query = """
-        SELECT StateName, LimitValue
-        FROM TDWM.RuleLimits
-        WHERE ConfigName = ? AND RuleName = ?
-        ORDER BY StateName
-        """
-        rows = cur.execute(query, [ruleset_name, throttle_name])
         limits = []
-        for row in rows.fetchall():
+        for row in limit_rows:
             limits.append({
                 "state": row[0],
                 "limit": int(row[1]) if row[1] else None
             })
 
-        # Get classification criteria
-        query = """
-        SELECT ClassificationType, ClassificationValue, Operator
-        FROM TDWM.RuleClassifications
-        WHERE ConfigName = ? AND RuleName = ?
-        ORDER BY ClassificationType
-        """
-        rows = cur.execute(query, [ruleset_name, throttle_name])
         classifications = []
-        for row in rows.fetchall():
+        for row in classification_rows:
             classifications.append({
                 "type": row[0],
                 "value": row[1],
@@ -286,9 +447,9 @@ async def get_throttle_details(ruleset_name: str, throttle_name: str) -> str:
         result = {
             "ruleset_name": ruleset_name,
             "throttle_name": throttle_info[0],
-            "description": throttle_info[1] if throttle_info[1] else "",
+            "description": _text(throttle_info[1]),
             "enabled": throttle_info[2] == 'Y',
-            "created": str(throttle_info[3]) if throttle_info[3] else None,
+            "created": _timestamp(throttle_info[3]),
             "limits": limits,
             "classification_criteria": classifications,
             "uri": f"tdwm://ruleset/{ruleset_name}/throttle/{throttle_name}"
@@ -297,7 +458,7 @@ async def get_throttle_details(ruleset_name: str, throttle_name: str) -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting throttle details: {e}")
+        logger.error("Error getting throttle details: %s", e)
         return format_error_response(str(e))
 
 
@@ -305,6 +466,7 @@ async def get_throttle_details(ruleset_name: str, throttle_name: str) -> str:
 # FILTERS INSPECTION
 # =============================================================================
 
+@_ttl_cache(RULE_DETAILS_CACHE_TTL)
 async def get_ruleset_filters(ruleset_name: str) -> str:
     """
     Get all filters defined in a specific ruleset.
@@ -314,39 +476,37 @@ async def get_ruleset_filters(ruleset_name: str) -> str:
         cur = tdconn.cursor()
 
         # Get all filters (RuleType = 2)
-        query = """
-        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
-        FROM TDWM.RuleDefs
-        WHERE ConfigName = ? AND RuleType = 2
-        ORDER BY RuleName
-        """
-        rows = cur.execute(query, [ruleset_name])
+        rows = _fetch_rows(cur, _SQL_RULESET_FILTERS, [ruleset_name])
 
         filters = []
-        for row in rows.fetchall():
+        enabled_count = 0
+        for row in rows:
+            enabled = row[2] == 'Y'
+            enabled_count += enabled
             filters.append({
                 "name": row[0],
-                "description": row[1] if row[1] else "",
-                "enabled": row[2] == 'Y',
-                "created": str(row[3]) if row[3] else None,
+                "description": _text(row[1]),
+                "enabled": enabled,
+                "created": _timestamp(row[3]),
                 "uri": f"tdwm://ruleset/{ruleset_name}/filter/{row[0]}"
             })
 
         result = {
             "ruleset_name": ruleset_name,
             "total_filters": len(filters),
-            "enabled_count": sum(1 for f in filters if f["enabled"]),
-            "disabled_count": sum(1 for f in filters if not f["enabled"]),
+            "enabled_count": enabled_count,
+            "disabled_count": len(filters) - enabled_count,
             "filters": filters
         }
 
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting filters for ruleset {ruleset_name}: {e}")
+        logger.error("Error getting filters for ruleset %s: %s", ruleset_name, e)
         return format_error_response(str(e))
 
 
+@_ttl_cache(RULE_DETAILS_CACHE_TTL)
 async def get_filter_details(ruleset_name: str, filter_name: str) -> str:
     """
     Get detailed configuration for a specific filter.
@@ -357,41 +517,23 @@ async def get_filter_details(ruleset_name: str, filter_name: str) -> str:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        # Get filter basic info
-        query = """
-        SELECT RuleName, Description, EnabledFlag, CreateTimeStamp
-        FROM TDWM.RuleDefs
-        WHERE ConfigName = ? AND RuleName = ? AND RuleType = 2
-        """
-        rows = cur.execute(query, [ruleset_name, filter_name])
-        filter_info = rows.fetchone()
+        # Filter info
+        info_rows = _fetch_rows(cur, _SQL_FILTER_INFO, [ruleset_name, filter_name])
 
-        if not filter_info:
+        if not info_rows:
             return format_error_response(
                 f"Filter '{filter_name}' not found in ruleset '{ruleset_name}'"
             )
+        filter_info = info_rows[0]
 
-        # Get filter action
-        # Note: Actual query structure depends on TDWM schema
-        query = """
-        SELECT ActionType
-        FROM TDWM.RuleActions
-        WHERE ConfigName = ? AND RuleName = ?
-        """
-        rows = cur.execute(query, [ruleset_name, filter_name])
-        action_row = rows.fetchone()
-        action = action_row[0] if action_row else None
+        # Action and classification criteria in one request
+        action_rows, classification_rows = _fetch_result_sets(
+            cur, _SQL_FILTER_DETAILS, [ruleset_name, filter_name] * 2
+        )
+        action = action_rows[0][0] if action_rows else None
 
-        # Get classification criteria
-        query = """
-        SELECT ClassificationType, ClassificationValue, Operator
-        FROM TDWM.RuleClassifications
-        WHERE ConfigName = ? AND RuleName = ?
-        ORDER BY ClassificationType
-        """
-        rows = cur.execute(query, [ruleset_name, filter_name])
         classifications = []
-        for row in rows.fetchall():
+        for row in classification_rows:
             classifications.append({
                 "type": row[0],
                 "value": row[1],
@@ -401,9 +543,9 @@ async def get_filter_details(ruleset_name: str, filter_name: str) -> str:
         result = {
             "ruleset_name": ruleset_name,
             "filter_name": filter_info[0],
-            "description": filter_info[1] if filter_info[1] else "",
+            "description": _text(filter_info[1]),
             "enabled": filter_info[2] == 'Y',
-            "created": str(filter_info[3]) if filter_info[3] else None,
+            "created": _timestamp(filter_info[3]),
             "action": action,
             "classification_criteria": classifications,
             "note": "Empty classification_criteria means filter matches ALL queries",
@@ -413,7 +555,7 @@ async def get_filter_details(ruleset_name: str, filter_name: str) -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting filter details: {e}")
+        logger.error("Error getting filter details: %s", e)
         return format_error_response(str(e))
 
 
@@ -421,6 +563,7 @@ async def get_filter_details(ruleset_name: str, filter_name: str) -> str:
 # SYSTEM STATE AND CONFIGURATION
 # =============================================================================
 
+@_ttl_cache(RULESET_CACHE_TTL)
 async def get_active_ruleset_name() -> str:
     """
     Get the name of the currently active ruleset.
@@ -431,20 +574,15 @@ async def get_active_ruleset_name() -> str:
         tdconn = await get_connection()
         cur = tdconn.cursor()
 
-        query = """
-        SELECT ConfigName, Description
-        FROM TDWM.Configurations
-        WHERE ActiveFlag = 'Y'
-        """
-        rows = cur.execute(query)
-        row = rows.fetchone()
+        rows = _fetch_rows(cur, _SQL_ACTIVE_RULESET)
+        row = rows[0] if rows else None
 
         if not row:
             return format_error_response("No active ruleset found")
 
         result = {
             "active_ruleset": row[0],
-            "description": row[1] if row[1] else "",
+            "description": _text(row[1]),
             "uri": f"tdwm://ruleset/{row[0]}",
             "note": "This is the ruleset currently enforcing workload management rules"
         }
@@ -452,7 +590,7 @@ async def get_active_ruleset_name() -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error getting active ruleset: {e}")
+        logger.error("Error getting active ruleset: %s", e)
         return format_error_response(str(e))
 
 
@@ -473,5 +611,5 @@ async def get_pending_changes(ruleset_name: str) -> str:
         return format_text_response(result)
 
     except Exception as e:
-        logger.error(f"Error checking pending changes: {e}")
+        logger.error("Error checking pending changes: %s", e)
         return format_error_response(str(e))
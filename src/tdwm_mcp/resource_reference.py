@@ -10,16 +10,41 @@ queried by LLMs before calling configuration tools.
 
 import logging
 import json
-from typing import Any, Optional, List, Dict
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from .tdwm_static import TDWM_CLASIFICATION_TYPE
 
+try:
+    import orjson  # optional: pip install tdwm-mcp[speedups]
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested reference data: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the mappingproxies produced by _freeze."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def format_text_response(data: Any) -> str:
     """Format data as text response."""
-    if isinstance(data, (dict, list)):
-        return json.dumps(data, indent=2)
+    if isinstance(data, (dict, list, MappingProxyType)):
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, default=_json_default)
     return str(data)
 
 
@@ -32,35 +57,60 @@ def format_error_response(error: str) -> str:
 # CLASSIFICATION TYPES REFERENCE
 # =============================================================================
 
-async def get_classification_types_all() -> str:
+CLASSIFICATION_CATEGORIES = ["Request Source", "Target", "Query Characteristics"]
+
+
+@cache
+def get_classification_types_all() -> str:
     """
     Get all classification types with detailed information.
 
     Returns all 31 classification types available in TDWM/TASM for
     creating throttles, filters, and workload rules.
     """
-    try:
-        result = []
-        for entry in TDWM_CLASIFICATION_TYPE:
-            result.append({
+    return format_text_response({
+        "total_types": len(TDWM_CLASIFICATION_TYPE),
+        "categories": CLASSIFICATION_CATEGORIES,
+        "classification_types": [
+            {
                 "key": entry[1],
                 "label": entry[2],
                 "category": entry[3],
                 "expected_value": entry[4],
                 "description": f"{entry[2]} - {entry[4]}"
+            }
+            for entry in TDWM_CLASIFICATION_TYPE
+        ]
+    })
+
+
+@cache
+def _classification_by_category_json() -> Dict[str, str]:
+    """Per-category classification responses, bucketed in one pass over the table."""
+    types_by_category: Dict[str, List[Dict[str, Any]]] = {
+        category: [] for category in CLASSIFICATION_CATEGORIES
+    }
+    for entry in TDWM_CLASIFICATION_TYPE:
+        bucket = types_by_category.get(entry[3])
+        if bucket is not None:
+            bucket.append({
+                "key": entry[1],
+                "label": entry[2],
+                "category": entry[3],
+                "expected_value": entry[4]
             })
 
-        return format_text_response({
-            "total_types": len(result),
-            "categories": ["Request Source", "Target", "Query Characteristics"],
-            "classification_types": result
+    return {
+        category: format_text_response({
+            "category": category,
+            "count": len(entries),
+            "classification_types": entries
         })
-    except Exception as e:
-        logger.error(f"Error getting classification types: {e}")
-        return format_error_response(str(e))
+        for category, entries in types_by_category.items()
+    }
 
 
-async def get_classification_types_by_category(category: str) -> str:
+def get_classification_types_by_category(category: str) -> str:
     """
     Get classification types filtered by category.
 
@@ -69,39 +119,21 @@ async def get_classification_types_by_category(category: str) -> str:
     - "Target" - DB, TABLE, VIEW, MACRO, SPROC, COLUMN, UDF
     - "Query Characteristics" - STMT, QUERYBAND, JOIN, UTILITY, etc.
     """
-    try:
-        valid_categories = ["Request Source", "Target", "Query Characteristics"]
-
-        if category not in valid_categories:
-            return format_error_response(
-                f"Invalid category '{category}'. Valid categories: {', '.join(valid_categories)}"
-            )
-
-        result = []
-        for entry in TDWM_CLASIFICATION_TYPE:
-            if entry[3] == category:
-                result.append({
-                    "key": entry[1],
-                    "label": entry[2],
-                    "category": entry[3],
-                    "expected_value": entry[4]
-                })
-
-        return format_text_response({
-            "category": category,
-            "count": len(result),
-            "classification_types": result
-        })
-    except Exception as e:
-        logger.error(f"Error getting classification types by category: {e}")
-        return format_error_response(str(e))
+    response = _classification_by_category_json().get(category)
+
+    if response is None:
+        return format_error_response(
+            f"Invalid category '{category}'. Valid categories: {', '.join(CLASSIFICATION_CATEGORIES)}"
+        )
+
+    return response
 
 
 # =============================================================================
 # OPERATORS REFERENCE
 # =============================================================================
 
-OPERATORS_REFERENCE = {
+OPERATORS_REFERENCE = _freeze({
     "description": "Operators for classification criteria in TDWM rules",
     "operators": [
         {
@@ -138,28 +170,25 @@ OPERATORS_REFERENCE = {
         }
     ],
     "default_recommendation": "Use 'I' (Inclusion) for most simple rules"
-}
+})
 
 
-async def get_operators_reference() -> str:
+@cache
+def get_operators_reference() -> str:
     """
     Get operators reference for classification criteria.
 
     Operators control how classification criteria are combined
     in throttle and filter rules.
     """
-    try:
-        return format_text_response(OPERATORS_REFERENCE)
-    except Exception as e:
-        logger.error(f"Error getting operators reference: {e}")
-        return format_error_response(str(e))
+    return format_text_response(OPERATORS_REFERENCE)
 
 
 # =============================================================================
 # SUBCRITERIA TYPES REFERENCE
 # =============================================================================
 
-SUBCRITERIA_REFERENCE = {
+SUBCRITERIA_REFERENCE = _freeze({
     "description": "Sub-criteria types for advanced rule targeting in TDWM",
     "note": "Sub-criteria are added to TABLE, DB, or VIEW targets for fine-grained control",
     "subcriteria_types": [
@@ -231,28 +260,25 @@ SUBCRITERIA_REFERENCE = {
             "tool": "add_subcriteria_to_target"
         }
     ]
-}
+})
 
 
-async def get_subcriteria_reference() -> str:
+@cache
+def get_subcriteria_reference() -> str:
     """
     Get sub-criteria types reference for advanced rule targeting.
 
     Sub-criteria enable fine-grained control like targeting only full table scans,
     long-running queries, or specific join types on TABLE/DB/VIEW targets.
     """
-    try:
-        return format_text_response(SUBCRITERIA_REFERENCE)
-    except Exception as e:
-        logger.error(f"Error getting subcriteria reference: {e}")
-        return format_error_response(str(e))
+    return format_text_response(SUBCRITERIA_REFERENCE)
 
 
 # =============================================================================
 # ACTIONS REFERENCE
 # =============================================================================
 
-ACTIONS_REFERENCE = {
+ACTIONS_REFERENCE = _freeze({
     "description": "Action types for filter rules in TDWM",
     "note": "Actions determine what happens when a query matches a filter rule",
     "actions": [
@@ -281,27 +307,24 @@ ACTIONS_REFERENCE = {
         }
     ],
     "default_recommendation": "Use 'E' (Exception) to provide feedback to users"
-}
+})
 
 
-async def get_actions_reference() -> str:
+@cache
+def get_actions_reference() -> str:
     """
     Get actions reference for filter rules.
 
     Actions determine what happens when a query matches a filter.
     """
-    try:
-        return format_text_response(ACTIONS_REFERENCE)
-    except Exception as e:
-        logger.error(f"Error getting actions reference: {e}")
-        return format_error_response(str(e))
+    return format_text_response(ACTIONS_REFERENCE)
 
 
 # =============================================================================
 # THROTTLE TYPES REFERENCE
 # =============================================================================
 
-THROTTLE_TYPES_REFERENCE = {
+THROTTLE_TYPES_REFERENCE = _freeze({
     "description": "Throttle types for system throttles in TDWM",
     "throttle_types": [
         {
@@ -327,28 +350,25 @@ THROTTLE_TYPES_REFERENCE = {
         }
     ],
     "default_recommendation": "Use 'DM' (Disable Member) for most throttles"
-}
+})
 
 
-async def get_throttle_types_reference() -> str:
+@cache
+def get_throttle_types_reference() -> str:
     """
     Get throttle types reference.
 
     Throttle types control whether a throttle can be overridden during
     emergency situations or high-priority operations.
     """
-    try:
-        return format_text_response(THROTTLE_TYPES_REFERENCE)
-    except Exception as e:
-        logger.error(f"Error getting throttle types reference: {e}")
-        return format_error_response(str(e))
+    return format_text_response(THROTTLE_TYPES_REFERENCE)
 
 
 # =============================================================================
 # STATES REFERENCE
 # =============================================================================
 
-STATES_REFERENCE = {
+STATES_REFERENCE = _freeze({
     "description": "System states in TDWM/TASM workload management",
     "note": "States represent system resource availability levels",
     "states": [
@@ -377,100 +397,108 @@ STATES_REFERENCE = {
             "actions": "Emergency workload management, queries delayed/rejected"
         }
     ]
-}
+})
 
 
-async def get_states_reference() -> str:
+@cache
+def get_states_reference() -> str:
     """
     Get system states reference.
 
     States represent resource availability levels and trigger
     different workload management behaviors.
     """
-    try:
-        return format_text_response(STATES_REFERENCE)
-    except Exception as e:
-        logger.error(f"Error getting states reference: {e}")
-        return format_error_response(str(e))
+    return format_text_response(STATES_REFERENCE)
 
 
 # =============================================================================
 # COMPREHENSIVE REFERENCE CATALOG
 # =============================================================================
 
-async def get_reference_catalog() -> str:
+REFERENCE_CATALOG = _freeze({
+    "description": "Comprehensive catalog of TDWM reference data resources",
+    "version": "1.0.0",
+    "resources": [
+        {
+            "uri": "tdwm://reference/classification-types",
+            "name": "Classification Types",
+            "description": "All 31 classification types for rules",
+            "use_case": "See all available classification types with categories"
+        },
+        {
+            "uri": "tdwm://reference/classification-types/{category}",
+            "name": "Classification Types by Category",
+            "description": "Filter classification types by category",
+            "parameters": {
+                "category": CLASSIFICATION_CATEGORIES
+            },
+            "use_case": "Get only classification types for a specific category"
+        },
+        {
+            "uri": "tdwm://reference/operators",
+            "name": "Classification Operators",
+            "description": "Operators for classification criteria (I, O, IO)",
+            "use_case": "Understand how to combine multiple criteria"
+        },
+        {
+            "uri": "tdwm://reference/subcriteria-types",
+            "name": "Sub-Criteria Types",
+            "description": "Advanced targeting options (FTSCAN, MINSTEPTIME, etc.)",
+            "use_case": "Add fine-grained control to TABLE/DB/VIEW rules"
+        },
+        {
+            "uri": "tdwm://reference/actions",
+            "name": "Filter Actions",
+            "description": "Actions for filter rules (E=Exception, A=Abort)",
+            "use_case": "Choose how to block queries in filters"
+        },
+        {
+            "uri": "tdwm://reference/throttle-types",
+            "name": "Throttle Types",
+            "description": "Throttle types (DM=Disable Member, M=Member)",
+            "use_case": "Choose throttle type when creating throttles"
+        },
+        {
+            "uri": "tdwm://reference/states",
+            "name": "System States",
+            "description": "TASM system states (GREEN, YELLOW, ORANGE, RED)",
+            "use_case": "Understand system state transitions"
+        },
+        {
+            "uri": "tdwm://reference/catalog",
+            "name": "Reference Catalog",
+            "description": "This catalog - directory of all reference resources",
+            "use_case": "Discover available reference data"
+        }
+    ],
+    "quick_links": {
+        "create_throttle": "Read tdwm://reference/classification-types and tdwm://reference/operators",
+        "create_filter": "Read tdwm://reference/classification-types and tdwm://reference/actions",
+        "add_subcriteria": "Read tdwm://reference/subcriteria-types",
+        "discover_all": "Read tdwm://reference/catalog"
+    }
+})
+
+
+@cache
+def get_reference_catalog() -> str:
     """
     Get comprehensive catalog of all reference resources.
 
     This provides a directory of all available reference data resources
     that LLMs can use to understand valid values and options.
     """
-    try:
-        catalog = {
-            "description": "Comprehensive catalog of TDWM reference data resources",
-            "version": "1.0.0",
-            "resources": [
-                {
-                    "uri": "tdwm://reference/classification-types",
-                    "name": "Classification Types",
-                    "description": "All 31 classification types for rules",
-                    "use_case": "See all available classification types with categories"
-                },
-                {
-                    "uri": "tdwm://reference/classification-types/{category}",
-                    "name": "Classification Types by Category",
-                    "description": "Filter classification types by category",
-                    "parameters": {
-                        "category": ["Request Source", "Target", "Query Characteristics"]
-                    },
-                    "use_case": "Get only classification types for a specific category"
-                },
-                {
-                    "uri": "tdwm://reference/operators",
-                    "name": "Classification Operators",
-                    "description": "Operators for classification criteria (I, O, IO)",
-                    "use_case": "Understand how to combine multiple criteria"
-                },
-                {
-                    "uri": "tdwm://reference/subcriteria-types",
-                    "name": "Sub-Criteria Types",
-                    "description": "Advanced targeting options (FTSCAN, MINSTEPTIME, etc.)",
-                    "use_case": "Add fine-grained control to TABLE/DB/VIEW rules"
-                },
-                {
-                    "uri": "tdwm://reference/actions",
-                    "name": "Filter Actions",
-                    "description": "Actions for filter rules (E=Exception, A=Abort)",
-                    "use_case": "Choose how to block queries in filters"
-                },
-                {
-                    "uri": "tdwm://reference/throttle-types",
-                    "name": "Throttle Types",
-                    "description": "Throttle types (DM=Disable Member, M=Member)",
-                    "use_case": "Choose throttle type when creating throttles"
-                },
-                {
-                    "uri": "tdwm://reference/states",
-                    "name": "System States",
-                    "description": "TASM system states (GREEN, YELLOW, ORANGE, RED)",
-                    "use_case": "Understand system state transitions"
-                },
-                {
-                    "uri": "tdwm://reference/catalog",
-                    "name": "Reference Catalog",
-                    "description": "This catalog - directory of all reference resources",
-                    "use_case": "Discover available reference data"
-                }
-            ],
-            "quick_links": {
-                "create_throttle": "Read tdwm://reference/classification-types and tdwm://reference/operators",
-                "create_filter": "Read tdwm://reference/classification-types and tdwm://reference/actions",
-                "add_subcriteria": "Read tdwm://reference/subcriteria-types",
-                "discover_all": "Read tdwm://reference/catalog"
-            }
-        }
-
-        return format_text_response(catalog)
-    except Exception as e:
-        logger.error(f"Error getting reference catalog: {e}")
-        return format_error_response(str(e))
+    return format_text_response(REFERENCE_CATALOG)
+
+
+# Static reference URIs mapped to their handlers for O(1) dispatch; the
+# parameterized classification-types/{category} URI is matched separately
+REFERENCE_HANDLERS: Mapping[str, Callable[[], str]] = MappingProxyType({
+    "tdwm://reference/classification-types": get_classification_types_all,
+    "tdwm://reference/operators": get_operators_reference,
+    "tdwm://reference/subcriteria-types": get_subcriteria_reference,
+    "tdwm://reference/actions": get_actions_reference,
+    "tdwm://reference/throttle-types": get_throttle_types_reference,
+    "tdwm://reference/states": get_states_reference,
+    "tdwm://reference/catalog": get_reference_catalog,
+})
@@ -14,15 +14,40 @@ All templates are exposed as resources that LLMs can read and apply.
 
 import logging
 import json
+from functools import cache
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # optional: pip install tdwm-mcp[speedups]
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested template data: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the mappingproxies produced by _freeze."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def format_text_response(data: Any) -> str:
     """Format data as text response."""
-    if isinstance(data, (dict, list)):
-        return json.dumps(data, indent=2)
+    if isinstance(data, (dict, list, MappingProxyType)):
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, default=_json_default)
     return str(data)
 
 
@@ -35,7 +60,7 @@ def format_error_response(error: str) -> str:
 # THROTTLE TEMPLATES
 # =============================================================================
 
-THROTTLE_TEMPLATES = {
+THROTTLE_TEMPLATES = _freeze({
     "application-basic": {
         "name": "Basic Application Throttle",
         "description": "Limit concurrent queries from a specific application",
@@ -334,14 +359,17 @@ THROTTLE_TEMPLATES = {
             "Useful for separating long-running batch jobs from quick queries"
         ]
     }
-}
+})
+
+# Listed in the not-found error for an unknown throttle template_id
+_THROTTLE_TEMPLATE_IDS = ", ".join(THROTTLE_TEMPLATES)
 
 
 # =============================================================================
 # FILTER TEMPLATES
 # =============================================================================
 
-FILTER_TEMPLATES = {
+FILTER_TEMPLATES = _freeze({
     "maintenance-window": {
         "name": "Maintenance Window Filter",
         "description": "Block all user queries during maintenance",
@@ -603,153 +631,177 @@ FILTER_TEMPLATES = {
             }
         }
     }
-}
+})
+
+# Listed in the not-found error for an unknown filter template_id
+_FILTER_TEMPLATE_IDS = ", ".join(FILTER_TEMPLATES)
 
 
 # =============================================================================
 # TEMPLATE CATALOG AND LOOKUP FUNCTIONS
 # =============================================================================
 
-async def get_throttle_templates_list() -> str:
+@cache
+def _throttle_templates_list_json() -> str:
+    """Throttle template summaries, serialized once on first read."""
+    templates_list = []
+    for key, template in THROTTLE_TEMPLATES.items():
+        templates_list.append({
+            "template_id": key,
+            "name": template["name"],
+            "description": template["description"],
+            "use_case": template["use_case"],
+            "complexity": template["complexity"],
+            "uri": f"tdwm://template/throttle/{key}"
+        })
+
+    return format_text_response({
+        "description": "Available throttle templates for common concurrency control patterns",
+        "total_templates": len(templates_list),
+        "templates": templates_list,
+        "usage": "Read a specific template URI to get detailed configuration and tool call information"
+    })
+
+
+def get_throttle_templates_list() -> str:
     """Get list of all available throttle templates."""
-    try:
-        templates_list = []
-        for key, template in THROTTLE_TEMPLATES.items():
-            templates_list.append({
-                "template_id": key,
-                "name": template["name"],
-                "description": template["description"],
-                "use_case": template["use_case"],
-                "complexity": template["complexity"],
-                "uri": f"tdwm://template/throttle/{key}"
-            })
-
-        return format_text_response({
-            "description": "Available throttle templates for common concurrency control patterns",
-            "total_templates": len(templates_list),
-            "templates": templates_list,
-            "usage": "Read a specific template URI to get detailed configuration and tool call information"
+    return _throttle_templates_list_json()
+
+
+@cache
+def _throttle_template_responses() -> Dict[str, str]:
+    """Serialized response for each throttle template, keyed by template_id."""
+    return {
+        key: format_text_response({
+            **template,
+            "template_id": key,
+            "uri": f"tdwm://template/throttle/{key}"
         })
-    except Exception as e:
-        logger.error(f"Error getting throttle templates list: {e}")
-        return format_error_response(str(e))
+        for key, template in THROTTLE_TEMPLATES.items()
+    }
 
 
-async def get_throttle_template(template_id: str) -> str:
+def get_throttle_template(template_id: str) -> str:
     """Get a specific throttle template by ID."""
-    try:
-        if template_id not in THROTTLE_TEMPLATES:
-            available = list(THROTTLE_TEMPLATES.keys())
-            return format_error_response(
-                f"Template '{template_id}' not found. Available templates: {', '.join(available)}"
-            )
+    response = _throttle_template_responses().get(template_id)
+    if response is None:
+        return format_error_response(
+            f"Template '{template_id}' not found. Available templates: {_THROTTLE_TEMPLATE_IDS}"
+        )
 
-        template = THROTTLE_TEMPLATES[template_id].copy()
-        template["template_id"] = template_id
-        template["uri"] = f"tdwm://template/throttle/{template_id}"
+    return response
+
+
+@cache
+def _filter_templates_list_json() -> str:
+    """Filter template summaries, serialized once on first read."""
+    templates_list = []
+    for key, template in FILTER_TEMPLATES.items():
+        templates_list.append({
+            "template_id": key,
+            "name": template["name"],
+            "description": template["description"],
+            "use_case": template["use_case"],
+            "complexity": template["complexity"],
+            "uri": f"tdwm://template/filter/{key}"
+        })
 
-        return format_text_response(template)
-    except Exception as e:
-        logger.error(f"Error getting throttle template: {e}")
-        return format_error_response(str(e))
+    return format_text_response({
+        "description": "Available filter templates for common query blocking patterns",
+        "total_templates": len(templates_list),
+        "templates": templates_list,
+        "usage": "Read a specific template URI to get detailed configuration and tool call information"
+    })
 
 
-async def get_filter_templates_list() -> str:
+def get_filter_templates_list() -> str:
     """Get list of all available filter templates."""
-    try:
-        templates_list = []
-        for key, template in FILTER_TEMPLATES.items():
-            templates_list.append({
-                "template_id": key,
-                "name": template["name"],
-                "description": template["description"],
-                "use_case": template["use_case"],
-                "complexity": template["complexity"],
-                "uri": f"tdwm://template/filter/{key}"
-            })
-
-        return format_text_response({
-            "description": "Available filter templates for common query blocking patterns",
-            "total_templates": len(templates_list),
-            "templates": templates_list,
-            "usage": "Read a specific template URI to get detailed configuration and tool call information"
+    return _filter_templates_list_json()
+
+
+@cache
+def _filter_template_responses() -> Dict[str, str]:
+    """Serialized response for each filter template, keyed by template_id."""
+    return {
+        key: format_text_response({
+            **template,
+            "template_id": key,
+            "uri": f"tdwm://template/filter/{key}"
         })
-    except Exception as e:
-        logger.error(f"Error getting filter templates list: {e}")
-        return format_error_response(str(e))
+        for key, template in FILTER_TEMPLATES.items()
+    }
 
 
-async def get_filter_template(template_id: str) -> str:
+def get_filter_template(template_id: str) -> str:
     """Get a specific filter template by ID."""
-    try:
-        if template_id not in FILTER_TEMPLATES:
-            available = list(FILTER_TEMPLATES.keys())
-            return format_error_response(
-                f"Template '{template_id}' not found. Available templates: {', '.join(available)}"
-            )
+    response = _filter_template_responses().get(template_id)
+    if response is None:
+        return format_error_response(
+            f"Template '{template_id}' not found. Available templates: {_FILTER_TEMPLATE_IDS}"
+        )
 
-        template = FILTER_TEMPLATES[template_id].copy()
-        template["template_id"] = template_id
-        template["uri"] = f"tdwm://template/filter/{template_id}"
+    return response
 
-        return format_text_response(template)
-    except Exception as e:
-        logger.error(f"Error getting filter template: {e}")
-        return format_error_response(str(e))
 
+@cache
+def _templates_catalog_json() -> str:
+    """
+    Template catalog, serialized once on first read.
 
-async def get_templates_catalog() -> str:
-    """Get comprehensive catalog of all configuration templates."""
-    try:
-        catalog = {
-            "description": "Comprehensive catalog of TDWM configuration templates",
-            "version": "1.0.0",
-            "template_categories": [
-                {
-                    "category": "Throttle Templates",
-                    "uri": "tdwm://templates/throttle",
-                    "count": len(THROTTLE_TEMPLATES),
-                    "description": "Templates for limiting concurrent query execution",
-                    "templates": [
-                        {"id": key, "name": tpl["name"], "complexity": tpl["complexity"]}
-                        for key, tpl in THROTTLE_TEMPLATES.items()
-                    ]
-                },
-                {
-                    "category": "Filter Templates",
-                    "uri": "tdwm://templates/filter",
-                    "count": len(FILTER_TEMPLATES),
-                    "description": "Templates for blocking query execution",
-                    "templates": [
-                        {"id": key, "name": tpl["name"], "complexity": tpl["complexity"]}
-                        for key, tpl in FILTER_TEMPLATES.items()
-                    ]
-                },
-                {
-                    "category": "Workflows",
-                    "uri": "tdwm://workflows",
-                    "count": len(WORKFLOW_TEMPLATES),
-                    "description": "Step-by-step workflows for common operations",
-                    "note": "Workflows combine resources and tools for complete operations"
-                }
-            ],
-            "usage_guide": {
-                "step_1": "Browse templates by reading tdwm://templates/throttle or tdwm://templates/filter",
-                "step_2": "Read specific template: tdwm://template/throttle/{template_id}",
-                "step_3": "Fill in parameters from template definition",
-                "step_4": "Call tools in sequence as specified in tool_calls",
-                "step_5": "Activate changes with activate_ruleset"
+    Deferred to the first call because the catalog counts WORKFLOW_TEMPLATES,
+    which is defined further down this module.
+    """
+    catalog = {
+        "description": "Comprehensive catalog of TDWM configuration templates",
+        "version": "1.0.0",
+        "template_categories": [
+            {
+                "category": "Throttle Templates",
+                "uri": "tdwm://templates/throttle",
+                "count": len(THROTTLE_TEMPLATES),
+                "description": "Templates for limiting concurrent query execution",
+                "templates": [
+                    {"id": key, "name": tpl["name"], "complexity": tpl["complexity"]}
+                    for key, tpl in THROTTLE_TEMPLATES.items()
+                ]
             },
-            "complexity_levels": {
-                "Simple": "Single tool call, basic parameters",
-                "Advanced": "Multiple tool calls or complex criteria"
+            {
+                "category": "Filter Templates",
+                "uri": "tdwm://templates/filter",
+                "count": len(FILTER_TEMPLATES),
+                "description": "Templates for blocking query execution",
+                "templates": [
+                    {"id": key, "name": tpl["name"], "complexity": tpl["complexity"]}
+                    for key, tpl in FILTER_TEMPLATES.items()
+                ]
+            },
+            {
+                "category": "Workflows",
+                "uri": "tdwm://workflows",
+                "count": len(WORKFLOW_TEMPLATES),
+                "description": "Step-by-step workflows for common operations",
+                "note": "Workflows combine resources and tools for complete operations"
             }
+        ],
+        "usage_guide": {
+            "step_1": "Browse templates by reading tdwm://templates/throttle or tdwm://templates/filter",
+            "step_2": "Read specific template: tdwm://template/throttle/{template_id}",
+            "step_3": "Fill in parameters from template definition",
+            "step_4": "Call tools in sequence as specified in tool_calls",
+            "step_5": "Activate changes with activate_ruleset"
+        },
+        "complexity_levels": {
+            "Simple": "Single tool call, basic parameters",
+            "Advanced": "Multiple tool calls or complex criteria"
         }
+    }
 
-        return format_text_response(catalog)
-    except Exception as e:
-        logger.error(f"Error getting templates catalog: {e}")
-        return format_error_response(str(e))
+    return format_text_response(catalog)
+
+
+def get_templates_catalog() -> str:
+    """Get comprehensive catalog of all configuration templates."""
+    return _templates_catalog_json()
 
 
 # =============================================================================
@@ -1138,46 +1190,56 @@ WORKFLOW_TEMPLATES = {
     }
 }
 
+# Listed in the not-found error for an unknown workflow_id
+_WORKFLOW_IDS = ", ".join(WORKFLOW_TEMPLATES)
+
+
+@cache
+def _workflows_list_json() -> str:
+    """Workflow summaries, serialized once on first read."""
+    workflows_list = []
+    for key, workflow in WORKFLOW_TEMPLATES.items():
+        workflows_list.append({
+            "workflow_id": key,
+            "name": workflow["name"],
+            "description": workflow["description"],
+            "use_case": workflow["use_case"],
+            "estimated_time": workflow.get("estimated_time", "Varies"),
+            "uri": f"tdwm://workflow/{key}"
+        })
+
+    return format_text_response({
+        "description": "Available workflow templates for common TDWM operations",
+        "total_workflows": len(workflows_list),
+        "workflows": workflows_list,
+        "usage": "Read a specific workflow URI to get detailed step-by-step guidance"
+    })
+
 
-async def get_workflows_list() -> str:
+def get_workflows_list() -> str:
     """Get list of all available workflow templates."""
-    try:
-        workflows_list = []
-        for key, workflow in WORKFLOW_TEMPLATES.items():
-            workflows_list.append({
-                "workflow_id": key,
-                "name": workflow["name"],
-                "description": workflow["description"],
-                "use_case": workflow["use_case"],
-                "estimated_time": workflow.get("estimated_time", "Varies"),
-                "uri": f"tdwm://workflow/{key}"
-            })
-
-        return format_text_response({
-            "description": "Available workflow templates for common TDWM operations",
-            "total_workflows": len(workflows_list),
-            "workflows": workflows_list,
-            "usage": "Read a specific workflow URI to get detailed step-by-step guidance"
+    return _workflows_list_json()
+
+
+@cache
+def _workflow_responses() -> Dict[str, str]:
+    """Serialized response for each workflow, keyed by workflow_id."""
+    return {
+        key: format_text_response({
+            **workflow,
+            "workflow_id": key,
+            "uri": f"tdwm://workflow/{key}"
         })
-    except Exception as e:
-        logger.error(f"Error getting workflows list: {e}")
-        return format_error_response(str(e))
+        for key, workflow in WORKFLOW_TEMPLATES.items()
+    }
 
 
-async def get_workflow(workflow_id: str) -> str:
+def get_workflow(workflow_id: str) -> str:
     """Get a specific workflow by ID."""
-    try:
-        if workflow_id not in WORKFLOW_TEMPLATES:
-            available = list(WORKFLOW_TEMPLATES.keys())
-            return format_error_response(
-                f"Workflow '{workflow_id}' not found. Available workflows: {', '.join(available)}"
-            )
-
-        workflow = WORKFLOW_TEMPLATES[workflow_id].copy()
-        workflow["workflow_id"] = workflow_id
-        workflow["uri"] = f"tdwm://workflow/{workflow_id}"
-
-        return format_text_response(workflow)
-    except Exception as e:
-        logger.error(f"Error getting workflow: {e}")
-        return format_error_response(str(e))
+    response = _workflow_responses().get(workflow_id)
+    if response is None:
+        return format_error_response(
+            f"Workflow '{workflow_id}' not found. Available workflows: {_WORKFLOW_IDS}"
+        )
+
+    return response
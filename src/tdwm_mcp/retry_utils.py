@@ -9,6 +9,7 @@ Key Features:
 - Smart error detection (connection errors vs SQL errors)
 - Configurable retry attempts and delays
 - Exponential backoff with jitter
+- Shared retry budget to prevent retry storms during outages
 - Operation safety categorization (read/write/dangerous)
 - Detailed logging for troubleshooting
 """
@@ -17,8 +18,11 @@ import asyncio
 import logging
 import os
 import random
-from functools import wraps
-from typing import Callable, Any
+import re
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional, Tuple
+
+import teradatasql
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,8 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = int(os.environ.get("TOOL_MAX_RETRIES", "2"))
 INITIAL_RETRY_DELAY = float(os.environ.get("TOOL_RETRY_INITIAL_DELAY", "0.5"))
 MAX_RETRY_DELAY = float(os.environ.get("TOOL_MAX_RETRY_DELAY", "2.0"))
+RETRY_BUDGET = float(os.environ.get("TOOL_RETRY_BUDGET", "10"))
+RETRY_BUDGET_REFILL = float(os.environ.get("TOOL_RETRY_BUDGET_REFILL", "0.1"))
 
 # Teradata connection error patterns
 CONNECTION_ERROR_PATTERNS = [
@@ -54,6 +60,81 @@ CONNECTION_ERROR_CODES = [
     8017,  # Session limit exceeded
 ]
 
+# Teradata error codes for SQL and permission failures; retrying cannot help
+NON_RETRYABLE_ERROR_CODES = [
+    3523,  # User does not have the required access right
+    3524,  # User does not have the right to grant the access right
+    3706,  # Syntax error
+    3802,  # Database does not exist
+    3807,  # Object does not exist
+    3810,  # Column does not exist
+    5315,  # User lacks the required access right on the object
+]
+
+# Both lists compiled once so each check is a single regex scan
+_CONNECTION_PATTERN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CONNECTION_ERROR_PATTERNS),
+    re.IGNORECASE
+)
+_ERROR_CODE_RE = re.compile(r"\[Error (\d+)\]")
+_CONNECTION_ERROR_CODE_SET = frozenset(CONNECTION_ERROR_CODES)
+_NON_RETRYABLE_ERROR_CODE_SET = frozenset(NON_RETRYABLE_ERROR_CODES)
+
+# Driver exceptions raised for bad SQL or data, never for a lost connection
+_NON_RETRY_ERROR_TYPES = (
+    teradatasql.ProgrammingError,
+    teradatasql.DataError,
+    teradatasql.IntegrityError,
+)
+# Exception types that always count as connection errors. OperationalError is
+# not one of them: teradatasql raises it for every database error, so it only
+# counts when its message carries a connection error code or pattern.
+_CONNECTION_ERROR_TYPES = (
+    teradatasql.InterfaceError,
+    ConnectionError,
+)
+
+# Function name keywords that decide an operation's retry category
+DANGEROUS_KEYWORDS = (
+    "delete", "drop", "remove", "purge", "terminate", "abort",
+    "kill", "force", "reset", "clear", "flush"
+)
+READ_KEYWORDS = (
+    "show", "get", "list", "query", "search", "find", "check",
+    "view", "display", "fetch", "read", "select", "describe",
+    "explain", "analyze", "count", "exists"
+)
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries across all tools.
+
+    Each retry spends one token and each successful call refunds a fraction
+    of one, so during an outage retries stop once the budget is spent instead
+    of every tool call multiplying the load on the database.
+    """
+
+    def __init__(self, max_tokens: float, refill_per_success: float):
+        self.max_tokens = max_tokens
+        self.refill_per_success = refill_per_success
+        self.tokens = max_tokens
+
+    def try_spend(self) -> bool:
+        """Spend a token for one retry; False when the budget is exhausted."""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def record_success(self):
+        """Refund part of a token after a successful call."""
+        self.tokens = min(self.max_tokens, self.tokens + self.refill_per_success)
+
+
+# Shared by every decorated tool and retry_on_connection_error
+_retry_budget = RetryBudget(RETRY_BUDGET, RETRY_BUDGET_REFILL)
+
 
 def is_connection_error(error: Exception) -> bool:
     """
@@ -66,40 +147,50 @@ def is_connection_error(error: Exception) -> bool:
         True if the error is connection-related and should be retried
 
     Logic:
-    - OperationalError and InterfaceError are typically connection issues
     - ProgrammingError (SQL syntax) should NOT be retried
     - DataError (data type issues) should NOT be retried
     - IntegrityError (constraint violations) should NOT be retried
+    - SQL and permission error codes (NON_RETRYABLE_ERROR_CODES) should NOT
+      be retried, whatever the exception type
+    - InterfaceError and ConnectionError are connection issues
+    - OperationalError is retried only for a connection error code or pattern
     """
-    error_str = str(error).lower()
-    error_type = type(error).__name__
-
     # Check error type
-    if error_type in ["ProgrammingError", "DataError", "IntegrityError"]:
+    if isinstance(error, _NON_RETRY_ERROR_TYPES):
         # These are code/data errors, not connection errors
-        logger.debug(f"Not retrying {error_type}: {error}")
+        logger.debug(f"Not retrying {type(error).__name__}: {error}")
         return False
 
+    error_str = str(error)
+    codes = [int(match.group(1)) for match in _ERROR_CODE_RE.finditer(error_str)]
+
+    # SQL and permission errors come back as OperationalError too
+    for code in codes:
+        if code in _NON_RETRYABLE_ERROR_CODE_SET:
+            logger.debug(f"Not retrying Teradata error code {code}")
+            return False
+
+    # Check for specific error types that indicate connection issues
+    if isinstance(error, _CONNECTION_ERROR_TYPES):
+        logger.debug(f"Detected connection error type: {type(error).__name__}")
+        return True
+
     # Check for Teradata error codes
-    for code in CONNECTION_ERROR_CODES:
-        if f"[Error {code}]" in str(error):
+    for code in codes:
+        if code in _CONNECTION_ERROR_CODE_SET:
             logger.debug(f"Detected Teradata connection error code {code}")
             return True
 
     # Check error message patterns
-    for pattern in CONNECTION_ERROR_PATTERNS:
-        if pattern in error_str:
-            logger.debug(f"Detected connection error pattern: {pattern}")
-            return True
-
-    # Check for specific error types that indicate connection issues
-    if error_type in ["OperationalError", "InterfaceError", "ConnectionError"]:
-        logger.debug(f"Detected connection error type: {error_type}")
+    match = _CONNECTION_PATTERN_RE.search(error_str)
+    if match:
+        logger.debug(f"Detected connection error pattern: {match.group(0).lower()}")
         return True
 
     return False
 
 
+@lru_cache(maxsize=512)
 def categorize_operation(func_name: str) -> str:
     """
     Categorize a tool operation by safety level for retry logic.
@@ -118,21 +209,12 @@ def categorize_operation(func_name: str) -> str:
     func_lower = func_name.lower()
 
     # Dangerous operations - NO RETRY
-    dangerous_keywords = [
-        "delete", "drop", "remove", "purge", "terminate", "abort",
-        "kill", "force", "reset", "clear", "flush"
-    ]
-    for keyword in dangerous_keywords:
+    for keyword in DANGEROUS_KEYWORDS:
         if keyword in func_lower:
             return "dangerous"
 
     # Read operations - FULL RETRY
-    read_keywords = [
-        "show", "get", "list", "query", "search", "find", "check",
-        "view", "display", "fetch", "read", "select", "describe",
-        "explain", "analyze", "count", "exists"
-    ]
-    for keyword in read_keywords:
+    for keyword in READ_KEYWORDS:
         if keyword in func_lower:
             return "read"
 
@@ -140,6 +222,107 @@ def categorize_operation(func_name: str) -> str:
     return "write"
 
 
+def _is_error_response(result: Any) -> bool:
+    """True for an "Error: ..." response returned by format_error_response."""
+    if isinstance(result, list) and len(result) == 1:
+        result = getattr(result[0], "text", None)
+    return isinstance(result, str) and result.startswith("Error: ")
+
+
+def _record_result(result: Any) -> None:
+    """
+    Refund the retry budget for a successful call.
+
+    Tools catch their own connection failures and return an error response, so
+    those returns must not refill the budget during an outage.
+    """
+    if not _is_error_response(result):
+        _retry_budget.record_success()
+
+
+def _backoff_delays(retries: int, initial_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """Exponential backoff delay before each retry, capped at max_delay."""
+    return tuple(min(initial_delay * (2 ** attempt), max_delay) for attempt in range(retries))
+
+
+async def _run_with_retry(
+    operation: Callable,
+    label: str,
+    delays: Tuple[float, ...],
+    category: Optional[str] = None
+) -> Any:
+    """
+    Await operation(), retrying connection errors once per entry in delays.
+
+    Shared by with_connection_retry and retry_on_connection_error.
+
+    Args:
+        operation: Zero-argument callable returning a new awaitable per attempt
+        label: How the operation is named in logs, e.g. "Tool 'list_sessions'"
+        delays: Base delay before each retry; its length is the retry count
+        category: Operation category shown in retry warnings, if any
+    """
+    allowed_retries = len(delays)
+    retry_label = f"{label} (category: {category})" if category else label
+    last_error = None
+
+    for attempt in range(allowed_retries + 1):
+        try:
+            # Attempt to execute the operation
+            result = await operation()
+            _record_result(result)
+
+            # If we succeeded after a retry, log it
+            if attempt > 0:
+                logger.info(
+                    f"{label} succeeded on retry attempt {attempt}/{allowed_retries}"
+                )
+
+            return result
+
+        except Exception as e:
+            last_error = e
+
+            # Check if this is a connection error
+            if not is_connection_error(e):
+                # Not a connection error, don't retry
+                logger.debug(
+                    f"{label} failed with non-connection error: {type(e).__name__}"
+                )
+                raise
+
+            # This is a connection error
+            if attempt < allowed_retries and not _retry_budget.try_spend():
+                logger.error(
+                    f"{label} connection error and retry budget exhausted; "
+                    f"not retrying: {str(e)[:200]}"
+                )
+                raise
+
+            if attempt < allowed_retries:
+                # Add jitter (±25%)
+                delay_with_jitter = delays[attempt] * random.uniform(0.75, 1.25)
+
+                logger.warning(
+                    f"{retry_label} "
+                    f"connection error on attempt {attempt + 1}/{allowed_retries + 1}. "
+                    f"Retrying in {delay_with_jitter:.2f}s... Error: {str(e)[:100]}"
+                )
+
+                await asyncio.sleep(delay_with_jitter)
+            else:
+                # All retries exhausted
+                logger.error(
+                    f"{label} failed after {allowed_retries + 1} attempts "
+                    f"with connection error: {str(e)[:200]}"
+                )
+                raise
+
+    # Should not reach here, but just in case
+    if last_error:
+        raise last_error
+
+
 def with_connection_retry(
     max_retries: int = None,
     initial_delay: float = None,
@@ -163,6 +346,7 @@ def with_connection_retry(
     - Detects connection errors using is_connection_error()
     - Adjusts retry count based on operation category
     - Uses exponential backoff with jitter
+    - Stops retrying when the shared retry budget is exhausted
     - Logs all retry attempts
     - Re-raises the error if all retries fail
     """
@@ -172,74 +356,36 @@ def with_connection_retry(
     _max_delay = max_delay if max_delay is not None else MAX_RETRY_DELAY
 
     def decorator(func: Callable) -> Callable:
+        # The category depends only on the function name, so it is settled
+        # once here rather than on every call
+        func_name = func.__name__
+        operation_category = categorize_operation(func_name)
+
+        # Adjust retries based on operation category
+        if operation_category == "dangerous":
+            allowed_retries = 0  # No retry for dangerous operations
+        elif operation_category == "write":
+            allowed_retries = min(1, _max_retries)  # Max 1 retry for writes
+        else:  # read
+            allowed_retries = _max_retries  # Full retries for reads
+
+        if allowed_retries == 0:
+            # Nothing to retry; only feed the shared retry budget
+            @wraps(func)
+            async def passthrough(*args, **kwargs) -> Any:
+                result = await func(*args, **kwargs)
+                _record_result(result)
+                return result
+            return passthrough
+
+        delays = _backoff_delays(allowed_retries, _initial_delay, _max_delay)
+        label = f"Tool '{func_name}'"
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            func_name = func.__name__
-            operation_category = categorize_operation(func_name)
-
-            # Adjust retries based on operation category
-            if operation_category == "dangerous":
-                allowed_retries = 0  # No retry for dangerous operations
-            elif operation_category == "write":
-                allowed_retries = min(1, _max_retries)  # Max 1 retry for writes
-            else:  # read
-                allowed_retries = _max_retries  # Full retries for reads
-
-            last_error = None
-
-            for attempt in range(allowed_retries + 1):
-                try:
-                    # Attempt to execute the function
-                    result = await func(*args, **kwargs)
-
-                    # If we succeeded after a retry, log it
-                    if attempt > 0:
-                        logger.info(
-                            f"Tool '{func_name}' succeeded on retry attempt {attempt}/{allowed_retries}"
-                        )
-
-                    return result
-
-                except Exception as e:
-                    last_error = e
-
-                    # Check if this is a connection error
-                    if not is_connection_error(e):
-                        # Not a connection error, don't retry
-                        logger.debug(
-                            f"Tool '{func_name}' failed with non-connection error: {type(e).__name__}"
-                        )
-                        raise
-
-                    # This is a connection error
-                    if attempt < allowed_retries:
-                        # Calculate delay with exponential backoff and jitter
-                        delay = min(
-                            _initial_delay * (2 ** attempt),
-                            _max_delay
-                        )
-                        # Add jitter (±25%)
-                        jitter = delay * 0.25 * (2 * random.random() - 1)
-                        delay_with_jitter = max(0, delay + jitter)
-
-                        logger.warning(
-                            f"Tool '{func_name}' (category: {operation_category}) "
-                            f"connection error on attempt {attempt + 1}/{allowed_retries + 1}. "
-                            f"Retrying in {delay_with_jitter:.2f}s... Error: {str(e)[:100]}"
-                        )
-
-                        await asyncio.sleep(delay_with_jitter)
-                    else:
-                        # All retries exhausted
-                        logger.error(
-                            f"Tool '{func_name}' failed after {allowed_retries + 1} attempts "
-                            f"with connection error: {str(e)[:200]}"
-                        )
-                        raise
-
-            # Should not reach here, but just in case
-            if last_error:
-                raise last_error
+            return await _run_with_retry(
+                lambda: func(*args, **kwargs), label, delays, operation_category
+            )
 
         return wrapper
     return decorator
@@ -275,45 +421,8 @@ async def retry_on_connection_error(
             operation_name="some_async_function"
         )
     """
-    last_error = None
-
-    for attempt in range(max_retries + 1):
-        try:
-            result = await operation()
-
-            if attempt > 0:
-                logger.info(
-                    f"Operation '{operation_name}' succeeded on retry attempt {attempt}/{max_retries}"
-                )
-
-            return result
-
-        except Exception as e:
-            last_error = e
-
-            if not is_connection_error(e):
-                logger.debug(
-                    f"Operation '{operation_name}' failed with non-connection error: {type(e).__name__}"
-                )
-                raise
-
-            if attempt < max_retries:
-                delay = min(initial_delay * (2 ** attempt), max_delay)
-                jitter = delay * 0.25 * (2 * random.random() - 1)
-                delay_with_jitter = max(0, delay + jitter)
-
-                logger.warning(
-                    f"Operation '{operation_name}' connection error on attempt {attempt + 1}/{max_retries + 1}. "
-                    f"Retrying in {delay_with_jitter:.2f}s... Error: {str(e)[:100]}"
-                )
-
-                await asyncio.sleep(delay_with_jitter)
-            else:
-                logger.error(
-                    f"Operation '{operation_name}' failed after {max_retries + 1} attempts "
-                    f"with connection error: {str(e)[:200]}"
-                )
-                raise
-
-    if last_error:
-        raise last_error
+    return await _run_with_retry(
+        operation,
+        f"Operation '{operation_name}'",
+        _backoff_delays(max_retries, initial_delay, max_delay)
+    )
@@ -6,6 +6,8 @@ import argparse
 import asyncio
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from starlette.applications import Starlette
 from mcp.server.sse import SseServerTransport
 from starlette.requests import Request
@@ -298,11 +300,33 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
         routes=routes,
     )
 
+def start_log_listener() -> QueueListener:
+    """
+    Move the root log handlers behind a queue.
+
+    Tools log from the event loop; QueueHandler still formats each record
+    there, but the listener thread does the stream/file I/O so a slow log
+    sink cannot stall other requests.
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 async def main():
     """Main entry point for the server."""
     # Configure logging
     logging.basicConfig(level=logging.INFO)
-    
+    log_listener = start_log_listener()
+    try:
+        await _serve()
+    finally:
+        log_listener.stop()
+
+async def _serve():
+    """Initialize OAuth and the database, then run the configured transport."""
     # Initialize OAuth authentication
     await initialize_oauth()
     
@@ -34,6 +34,12 @@ TDWM_CLASIFICATION_TYPE = [
     (30, "QUERYBAND",  "Query Band",                        "Query Band", "Query Band name-value pair"),
 ]
 
+# (key, label, category, expected value) listing returned by the classification
+# tool and resource; built once since the table never changes
+TDWM_CLASIFICATION_TYPE_TEXT = str(
+    [(entry[1], entry[2], entry[3], entry[4]) for entry in TDWM_CLASIFICATION_TYPE]
+)
+
 # Example function to retrieve by index
 def get_tdwm_static_by_index(idx: int):
     return TDWM_CLASIFICATION_TYPE[idx] if 0 <= idx < len(TDWM_CLASIFICATION_TYPE) else None